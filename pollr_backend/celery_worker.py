@@ -20,4 +20,10 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'pollr_backend.settings')
 from pollr_backend.background_tasks.celery import app
 
 if __name__ == '__main__':
-    app.start(['worker', '--loglevel=info'])
+    app.worker_main(argv=[
+        'worker',
+        '--loglevel=info',
+        '--pool=prefork',
+        f"--concurrency={os.environ.get('CELERY_WORKER_CONCURRENCY', '4')}",
+        '-Ofair',  # Prefetch comes from CELERY_WORKER_PREFETCH_MULTIPLIER
+    ])
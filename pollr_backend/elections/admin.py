@@ -1,5 +1,9 @@
 from django.contrib import admin
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from .models import Election, Position, Candidate
+from organizations.models import OrganizationMember, MembershipStatus
+from voting.models import Vote
 
 
 class PositionInline(admin.TabularInline):
@@ -14,6 +18,7 @@ class ElectionAdmin(admin.ModelAdmin):
     """Admin configuration for Election model."""
     
     list_display = ['title', 'organization', 'status', 'start_at', 'end_at', 'get_total_votes', 'created_at']
+    list_select_related = ('organization',)
     list_filter = ['status', 'result_visibility', 'created_at']
     search_fields = ['title', 'organization__name']
     readonly_fields = ['status', 'created_at', 'updated_at', 'get_total_votes', 'get_voter_turnout']
@@ -39,14 +44,28 @@ class ElectionAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Annotate vote and member counts and skip wide text columns."""
+        return super().get_queryset(request).annotate(
+            _total_votes=Count('votes', distinct=True),
+            _total_voters=Count('votes__user', distinct=True),
+            _member_count=OrganizationMember.count_subquery(
+                'organization',
+                membership_status=MembershipStatus.APPROVED
+            ),
+        ).defer('description')
+    
     def get_total_votes(self, obj):
         """Display total votes."""
-        return obj.get_total_votes()
+        return obj._total_votes
     get_total_votes.short_description = 'Total Votes'
+    get_total_votes.admin_order_field = '_total_votes'
     
     def get_voter_turnout(self, obj):
         """Display voter turnout."""
-        return f"{obj.get_voter_turnout():.2f}%"
+        total_eligible = obj._member_count + 1  # +1 for owner
+        turnout = (obj._total_voters / total_eligible) * 100
+        return f"{turnout:.2f}%"
     get_voter_turnout.short_description = 'Voter Turnout'
 
 
@@ -62,6 +81,7 @@ class PositionAdmin(admin.ModelAdmin):
     """Admin configuration for Position model."""
     
     list_display = ['title', 'election', 'order_index', 'get_candidates_count', 'get_total_votes']
+    list_select_related = ('election__organization',)
     list_filter = ['election__status', 'created_at']
     search_fields = ['title', 'election__title']
     readonly_fields = ['created_at', 'updated_at']
@@ -77,15 +97,36 @@ class PositionAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Annotate candidate and vote counts and skip wide text columns."""
+        # Correlated counts, since joining both relations multiplies the rows
+        candidates = Candidate.objects.filter(
+            position=OuterRef('pk')
+        ).order_by().values('position').annotate(
+            count=Count('pk')
+        ).values('count')
+        votes = Vote.objects.filter(
+            position=OuterRef('pk')
+        ).order_by().values('position').annotate(
+            count=Count('pk')
+        ).values('count')
+        
+        return super().get_queryset(request).annotate(
+            _candidates_count=Coalesce(Subquery(candidates), 0),
+            _total_votes=Coalesce(Subquery(votes), 0),
+        ).defer('description')
+    
     def get_candidates_count(self, obj):
         """Display candidates count."""
-        return obj.get_candidates_count()
+        return obj._candidates_count
     get_candidates_count.short_description = 'Candidates'
+    get_candidates_count.admin_order_field = '_candidates_count'
     
     def get_total_votes(self, obj):
         """Display total votes."""
-        return obj.get_total_votes()
+        return obj._total_votes
     get_total_votes.short_description = 'Total Votes'
+    get_total_votes.admin_order_field = '_total_votes'
 
 
 @admin.register(Candidate)
@@ -93,6 +134,7 @@ class CandidateAdmin(admin.ModelAdmin):
     """Admin configuration for Candidate model."""
     
     list_display = ['name', 'position', 'user', 'get_vote_count', 'created_at']
+    list_select_related = ('position__election', 'user')
     list_filter = ['position__election__status', 'created_at']
     search_fields = ['name', 'user__email', 'position__title']
     readonly_fields = ['created_at', 'updated_at', 'get_vote_count', 'get_vote_percentage']
@@ -114,12 +156,29 @@ class CandidateAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Annotate vote counts and skip wide text columns."""
+        position_votes = Vote.objects.filter(
+            position=OuterRef('position')
+        ).order_by().values('position').annotate(
+            count=Count('pk')
+        ).values('count')
+        
+        return super().get_queryset(request).annotate(
+            _vote_count=Count('votes'),
+            _position_total_votes=Coalesce(Subquery(position_votes), 0),
+        ).defer('manifesto', 'photo_url')
+    
     def get_vote_count(self, obj):
         """Display vote count."""
-        return obj.get_vote_count()
+        return obj._vote_count
     get_vote_count.short_description = 'Votes'
+    get_vote_count.admin_order_field = '_vote_count'
     
     def get_vote_percentage(self, obj):
         """Display vote percentage."""
-        return f"{obj.get_vote_percentage():.2f}%"
+        if obj._position_total_votes == 0:
+            return "0.00%"
+        percentage = (obj._vote_count / obj._position_total_votes) * 100
+        return f"{percentage:.2f}%"
     get_vote_percentage.short_description = 'Vote %'
\ No newline at end of file
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.8 on 2026-10-14 17:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0001_initial'),
+        ('organizations', '0007_organizationmember_user_org_status_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='election',
+            name='elections_status_eb3191_idx',
+        ),
+        migrations.AddIndex(
+            model_name='election',
+            index=models.Index(fields=['status', 'organization'], name='elections_status_2bafad_idx'),
+        ),
+    ]
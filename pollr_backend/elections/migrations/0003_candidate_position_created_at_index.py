@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-14 17:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0002_election_status_organization_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='candidate',
+            name='candidates_positio_f788c0_idx',
+        ),
+        migrations.AddIndex(
+            model_name='candidate',
+            index=models.Index(fields=['position', 'created_at'], name='candidates_positio_d57f2a_idx'),
+        ),
+    ]
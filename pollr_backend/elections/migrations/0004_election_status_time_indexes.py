@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-14 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0003_candidate_position_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='election',
+            index=models.Index(fields=['status', 'start_at'], name='elections_status_60f200_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='election',
+            index=models.Index(fields=['status', 'end_at'], name='elections_status_08d38e_idx'),
+        ),
+    ]
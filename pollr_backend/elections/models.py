@@ -1,7 +1,20 @@
 from django.db import models
+from django.db.models import Count
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.utils import timezone
+from django.utils.functional import cached_property
+
+# How long cached vote statistics are served before being recomputed (seconds)
+STATS_CACHE_TIMEOUT = 60
+
+# Per-process backends: web and Celery workers would never see each other's
+# invalidations, so vote statistics are only cached in shared backends
+PROCESS_LOCAL_CACHE_BACKENDS = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
 
 
 class ElectionStatus(models.TextChoices):
@@ -46,9 +59,14 @@ class Election(models.Model):
         db_table = 'elections'
         ordering = ['-created_at']
         indexes = [
+            # by_organization filters one organization, then optionally status
             models.Index(fields=['organization', 'status']),
-            models.Index(fields=['status']),
+            # active/upcoming/completed filter one status across organizations
+            models.Index(fields=['status', 'organization']),
             models.Index(fields=['start_at', 'end_at']),
+            # Status sweeps only touch elections whose start or end has passed
+            models.Index(fields=['status', 'start_at']),
+            models.Index(fields=['status', 'end_at']),
         ]
     
     def __str__(self):
@@ -60,37 +78,46 @@ class Election(models.Model):
             raise ValidationError("End time must be after start time.")
     
     def save(self, *args, **kwargs):
-        """Override save to validate and update status."""
-        self.clean()
-        self.update_status()
+        """Override save to update status."""
+        # Partial saves (e.g. start/end) manage status themselves
+        if kwargs.get('update_fields') is None:
+            self.status = self.compute_status()
         super().save(*args, **kwargs)
     
-    def update_status(self):
-        """Update election status based on current time."""
-        now = timezone.now()
-        
+    def compute_status(self):
+        """Return the election status based on current time."""
         if self.status == ElectionStatus.COMPLETED:
             # Don't change completed status
-            return
+            return self.status
         
+        now = timezone.now()
         if now < self.start_at:
-            self.status = ElectionStatus.SCHEDULED
-        elif self.start_at <= now < self.end_at:
-            self.status = ElectionStatus.ONGOING
-        elif now >= self.end_at:
-            self.status = ElectionStatus.COMPLETED
+            return ElectionStatus.SCHEDULED
+        elif now < self.end_at:
+            return ElectionStatus.ONGOING
+        return ElectionStatus.COMPLETED
+    
+    def update_status(self):
+        """Update election status based on current time."""
+        self.status = self.compute_status()
     
     def is_active(self):
         """Check if election is currently active."""
-        self.update_status()
-        return self.status == ElectionStatus.ONGOING
+        if self.status == ElectionStatus.COMPLETED:
+            return False
+        return self.start_at <= timezone.now() < self.end_at
     
     def can_vote(self):
         """Check if voting is allowed."""
         return self.is_active()
     
-    def can_view_results(self, user):
-        """Check if user can view results."""
+    def can_view_results(self, user, organization_ids=None):
+        """
+        Check if user can view results.
+        
+        organization_ids may hold the IDs of organizations the user owns or
+        belongs to, letting callers that check many elections skip the lookup.
+        """
         if self.result_visibility == ResultVisibility.PUBLIC:
             return True
         
@@ -99,34 +126,103 @@ class Election(models.Model):
             # Results not ready yet
             return False
         
-        return self.organization.is_member(user) or self.organization.owner == user
+        if organization_ids is not None:
+            return self.organization_id in organization_ids
+        
+        return self.organization.owner_id == user.id or self.organization.is_member(user)
+    
+    @staticmethod
+    def stats_cache_enabled():
+        """Whether vote statistics are cached in a backend every process shares."""
+        return settings.CACHES['default']['BACKEND'] not in PROCESS_LOCAL_CACHE_BACKENDS
+    
+    @staticmethod
+    def _stats_version_key(election_id):
+        """Build the key of the counter bumped whenever an election's votes change."""
+        return f"election:{election_id}:stats_version"
+    
+    def _stats_cache_key(self, name):
+        """Build the cache key for a vote statistic of this election."""
+        version = cache.get(self._stats_version_key(self.pk), 0)
+        return f"election:{self.pk}:{name}:{version}"
+    
+    @classmethod
+    def bump_stats_version(cls, election_id):
+        """Invalidate cached vote statistics without loading the election."""
+        if not cls.stats_cache_enabled():
+            return
+        key = cls._stats_version_key(election_id)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, 1, timeout=None)
+    
+    def clear_stats_cache(self):
+        """Invalidate cached vote statistics."""
+        self.bump_stats_version(self.pk)
+        self.__dict__.pop('_vote_stats', None)
+    
+    @cached_property
+    def _vote_stats(self):
+        """Vote totals for this election, shared by the stat getters."""
+        if not self.stats_cache_enabled():
+            return self._compute_vote_stats()
+        return cache.get_or_set(
+            self._stats_cache_key('vote_stats'),
+            self._compute_vote_stats,
+            timeout=STATS_CACHE_TIMEOUT
+        )
+    
+    def _compute_vote_stats(self):
+        """Count votes and distinct voters in a single aggregate query."""
+        return self.votes.aggregate(
+            total=Count('id'),
+            voters=Count('user', distinct=True)
+        )
     
     def get_total_votes(self):
         """Get total number of votes cast."""
-        from voting.models import Vote
-        return Vote.objects.filter(election=self).count()
+        return self._vote_stats['total']
     
     def get_voter_turnout(self):
         """Get voter turnout percentage."""
-        from voting.models import Vote
-        total_eligible = self.organization.get_member_count() + 1  # +1 for owner
+        if hasattr(self, '_member_count'):
+            member_count = self._member_count
+        else:
+            member_count = self.organization.get_member_count()
+        total_eligible = member_count + 1  # +1 for owner
         if total_eligible == 0:
             return 0
         
-        total_voters = Vote.objects.filter(election=self).values('voter').distinct().count()
-        return (total_voters / total_eligible) * 100
+        return (self._vote_stats['voters'] / total_eligible) * 100
+    
+    def _transition(self, from_statuses, to_status):
+        """
+        Move to to_status if the stored status is one of from_statuses.
+        
+        The check and the write happen in one conditional UPDATE, so two
+        concurrent requests cannot both apply the same transition.
+        """
+        now = timezone.now()
+        updated = Election.objects.filter(
+            pk=self.pk,
+            status__in=from_statuses
+        ).update(status=to_status, updated_at=now)
+        if updated:
+            self.status = to_status
+            self.updated_at = now
+        return bool(updated)
     
     def start(self):
-        """Manually start an election."""
-        if self.status == ElectionStatus.SCHEDULED:
-            self.status = ElectionStatus.ONGOING
-            super().save(update_fields=['status', 'updated_at'])
+        """Manually start an election. Returns whether it was started."""
+        return self._transition([ElectionStatus.SCHEDULED], ElectionStatus.ONGOING)
     
     def end(self):
-        """Manually end an election."""
-        if self.status in [ElectionStatus.SCHEDULED, ElectionStatus.ONGOING]:
-            self.status = ElectionStatus.COMPLETED
-            super().save(update_fields=['status', 'updated_at'])
+        """Manually end an election. Returns whether it was ended."""
+        return self._transition(
+            [ElectionStatus.SCHEDULED, ElectionStatus.ONGOING],
+            ElectionStatus.COMPLETED
+        )
 
 
 class Position(models.Model):
@@ -162,8 +258,7 @@ class Position(models.Model):
     
     def get_total_votes(self):
         """Get total votes for this position."""
-        from .voting.models import Vote
-        return Vote.objects.filter(position=self).count()
+        return self.votes.count()
 
 
 class Candidate(models.Model):
@@ -193,7 +288,7 @@ class Candidate(models.Model):
         db_table = 'candidates'
         ordering = ['created_at']
         indexes = [
-            models.Index(fields=['position']),
+            models.Index(fields=['position', 'created_at']),
             models.Index(fields=['user']),
         ]
     
@@ -205,7 +300,7 @@ class Candidate(models.Model):
         # If user is provided, ensure they're a member of the organization
         if self.user:
             election = self.position.election
-            if not election.organization.is_member(self.user) and election.organization.owner != self.user:
+            if election.organization.owner_id != self.user.id and not election.organization.is_member(self.user):
                 raise ValidationError(
                     "Candidate must be a member of the organization."
                 )
@@ -214,13 +309,55 @@ class Candidate(models.Model):
         """Override save to auto-populate name from user if not provided."""
         if self.user and not self.name:
             self.name = self.user.full_name
-        self.clean()
         super().save(*args, **kwargs)
     
+    @classmethod
+    def bulk_import(cls, position, user_ids, manifestos):
+        """
+        Create a slate of member candidates for a position in one INSERT.
+        
+        Users and memberships are fetched with one query each instead of
+        going through clean() and save() per candidate.
+        """
+        from django.contrib.auth import get_user_model
+        from organizations.models import MembershipStatus
+        
+        if len(user_ids) != len(manifestos):
+            raise ValidationError(
+                "Each candidate needs exactly one manifesto."
+            )
+        if len(set(user_ids)) != len(user_ids):
+            raise ValidationError(
+                "A user can only be imported once per position."
+            )
+        
+        organization = position.election.organization
+        member_ids = set(
+            organization.members.filter(
+                user_id__in=user_ids,
+                membership_status=MembershipStatus.APPROVED
+            ).values_list('user_id', flat=True)
+        )
+        member_ids.add(organization.owner_id)
+        if not member_ids.issuperset(user_ids):
+            raise ValidationError(
+                "Candidate must be a member of the organization."
+            )
+        
+        users = get_user_model().objects.in_bulk(user_ids)
+        return cls.objects.bulk_create([
+            cls(
+                position=position,
+                user=users[user_id],
+                name=users[user_id].full_name,
+                manifesto=manifesto
+            )
+            for user_id, manifesto in zip(user_ids, manifestos, strict=True)
+        ])
+    
     def get_vote_count(self):
         """Get number of votes for this candidate."""
-        from voting.models import Vote
-        return Vote.objects.filter(candidate=self).count()
+        return self.votes.count()
     
     def get_vote_percentage(self):
         """Get percentage of votes for this candidate."""
@@ -1,6 +1,5 @@
 from rest_framework import serializers
 from django.utils import timezone
-from django.db import models
 from .models import Election, Position, Candidate
 
 
@@ -21,10 +20,27 @@ class CandidateSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'vote_count', 'vote_percentage', 'created_at', 'updated_at']
     
+    def validate(self, attrs):
+        """Validate candidate membership."""
+        # A partial update may move either side, so check the resulting pair
+        user = attrs.get('user', getattr(self.instance, 'user', None))
+        position = attrs.get('position', getattr(self.instance, 'position', None))
+        if user and position and ('user' in attrs or 'position' in attrs):
+            organization = position.election.organization
+            if organization.owner_id != user.id and not organization.is_member(user):
+                raise serializers.ValidationError({
+                    'user': 'Candidate must be a member of the organization.'
+                })
+        
+        return attrs
+    
     def get_vote_count(self, obj):
         """Get vote count for candidate."""
         # Only show if election is completed
         if obj.position.election.status == 'completed':
+            tallies = self.context.get('tallies')
+            if tallies is not None:
+                return tallies.get(obj.id, 0)
             return obj.get_vote_count()
         return None
     
@@ -32,6 +48,13 @@ class CandidateSerializer(serializers.ModelSerializer):
         """Get vote percentage for candidate."""
         # Only show if election is completed
         if obj.position.election.status == 'completed':
+            tallies = self.context.get('tallies')
+            position_totals = self.context.get('position_totals')
+            if tallies is not None and position_totals is not None:
+                total_votes = position_totals.get(obj.position_id, 0)
+                if total_votes == 0:
+                    return 0
+                return round((tallies.get(obj.id, 0) / total_votes) * 100, 2)
             return round(obj.get_vote_percentage(), 2)
         return None
 
@@ -54,12 +77,17 @@ class PositionSerializer(serializers.ModelSerializer):
     
     def get_candidates_count(self, obj):
         """Get number of candidates."""
+        if hasattr(obj, '_candidates_count'):
+            return obj._candidates_count
         return obj.get_candidates_count()
     
     def get_total_votes(self, obj):
         """Get total votes for position."""
         # Only show if election is completed
         if obj.election.status == 'completed':
+            position_totals = self.context.get('position_totals')
+            if position_totals is not None:
+                return position_totals.get(obj.id, 0)
             return obj.get_total_votes()
         return None
 
@@ -74,7 +102,13 @@ class PositionDetailSerializer(PositionSerializer):
 
 
 class ElectionSerializer(serializers.ModelSerializer):
-    """Serializer for Election model."""
+    """
+    Serializer for Election model.
+    
+    The count and turnout fields read annotations added by
+    ElectionViewSet.get_queryset, falling back to queries for elections
+    loaded elsewhere.
+    """
     
     organization_name = serializers.CharField(source='organization.name', read_only=True)
     organization_slug = serializers.CharField(source='organization.slug', read_only=True)
@@ -98,8 +132,8 @@ class ElectionSerializer(serializers.ModelSerializer):
     
     def validate(self, attrs):
         """Validate election dates."""
-        start_at = attrs.get('start_at')
-        end_at = attrs.get('end_at')
+        start_at = attrs.get('start_at', getattr(self.instance, 'start_at', None))
+        end_at = attrs.get('end_at', getattr(self.instance, 'end_at', None))
         
         if start_at and end_at and start_at >= end_at:
             raise serializers.ValidationError({
@@ -108,16 +142,22 @@ class ElectionSerializer(serializers.ModelSerializer):
         
         return attrs
     
-    def get_positions_count(self, obj):
+    def get_positions_count(self, obj) -> int:
         """Get number of positions."""
+        if hasattr(obj, '_positions_count'):
+            return obj._positions_count
         return obj.positions.count()
     
-    def get_total_votes(self, obj):
+    def get_total_votes(self, obj) -> int:
         """Get total votes cast."""
+        if hasattr(obj, '_total_votes'):
+            return obj._total_votes
         return obj.get_total_votes()
     
-    def get_voter_turnout(self, obj):
+    def get_voter_turnout(self, obj) -> float:
         """Get voter turnout percentage."""
+        if hasattr(obj, '_turnout'):
+            return float(obj._turnout)
         return round(obj.get_voter_turnout(), 2)
     
     def get_can_vote(self, obj):
@@ -128,19 +168,22 @@ class ElectionSerializer(serializers.ModelSerializer):
         """Check if user can view results."""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            return obj.can_view_results(request.user)
+            return obj.can_view_results(
+                request.user,
+                organization_ids=self.context.get('user_org_ids')
+            )
         return False
     
     def get_has_voted(self, obj):
         """Check if current user has voted."""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
+            voted_election_ids = self.context.get('voted_election_ids')
+            if voted_election_ids is not None:
+                return obj.id in voted_election_ids
+            
             from voting.models import Vote
-            return Vote.objects.filter(
-                election=obj
-            ).filter(
-                models.Q(voter__user=request.user) | models.Q(voter_user=request.user)
-            ).exists()
+            return Vote.objects.filter(election=obj, user=request.user).exists()
         return False
 
 
@@ -199,7 +242,7 @@ class CandidateCreateSerializer(serializers.ModelSerializer):
         # If user is provided, check they're a member
         if user:
             election = position.election
-            if not election.organization.is_member(user) and election.organization.owner != user:
+            if election.organization.owner_id != user.id and not election.organization.is_member(user):
                 raise serializers.ValidationError({
                     'user': 'Candidate must be a member of the organization.'
                 })
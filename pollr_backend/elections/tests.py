@@ -1,16 +1,29 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from datetime import timedelta
 from rest_framework import status
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
 
 from .models import Election, Position, Candidate, ElectionStatus
+from .serializers import ElectionSerializer
 from organizations.models import Organization, OrganizationMember, MembershipStatus
+from voting.models import Vote
 
 User = get_user_model()
 
+ELECTION_LIST_URL = reverse('elections:election-list')
+ELECTION_ACTIVE_URL = reverse('elections:election-active')
+ELECTION_UPCOMING_URL = reverse('elections:election-upcoming')
+ELECTION_BY_ORGANIZATION_URL = reverse('elections:election-by-organization')
+POSITION_LIST_URL = reverse('elections:position-list')
+CANDIDATE_LIST_URL = reverse('elections:candidate-list')
+CANDIDATE_BY_POSITION_URL = reverse('elections:candidate-by-position')
+
 
 @pytest.fixture
 def api_client():
@@ -29,6 +42,13 @@ def user(db):
     )
 
 
+@pytest.fixture
+def user_client(api_client, user):
+    """Fixture for API client authenticated as the regular user."""
+    api_client.force_authenticate(user=user)
+    return api_client
+
+
 @pytest.fixture
 def another_user(db):
     """Fixture for another user."""
@@ -128,11 +148,8 @@ def candidate2(db, position, another_user):
 class TestElectionCRUD:
     """Test election CRUD operations."""
     
-    def test_create_election(self, api_client, user, organization):
+    def test_create_election(self, user_client, organization):
         """Test creating an election."""
-        api_client.force_authenticate(user=user)
-        url = reverse('elections:election-list')
-        
         start = timezone.now() + timedelta(days=1)
         end = start + timedelta(days=7)
         
@@ -145,16 +162,13 @@ class TestElectionCRUD:
             'result_visibility': 'public'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = user_client.post(ELECTION_LIST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
         assert Election.objects.filter(title='New Election').exists()
     
-    def test_create_election_invalid_dates(self, api_client, user, organization):
+    def test_create_election_invalid_dates(self, user_client, organization):
         """Test creating election with invalid dates."""
-        api_client.force_authenticate(user=user)
-        url = reverse('elections:election-list')
-        
         start = timezone.now() + timedelta(days=7)
         end = timezone.now() + timedelta(days=1)  # End before start
         
@@ -165,48 +179,186 @@ class TestElectionCRUD:
             'end_at': end.isoformat()
         }
         
-        response = api_client.post(url, data, format='json')
+        response = user_client.post(ELECTION_LIST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
     
-    def test_list_elections(self, api_client, user, election):
+    def test_list_elections(self, user_client, election):
         """Test listing elections."""
-        api_client.force_authenticate(user=user)
-        url = reverse('elections:election-list')
-        
-        response = api_client.get(url)
+        response = user_client.get(ELECTION_LIST_URL)
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) >= 1
     
-    def test_retrieve_election(self, api_client, user, election):
+    def test_list_elections_query_count(self, user_client, organization, election):
+        """Test that listing elections does not run queries per row."""
+        with CaptureQueriesContext(connection) as single:
+            user_client.get(ELECTION_LIST_URL)
+        
+        for i in range(3):
+            Election.objects.create(
+                organization=organization,
+                title=f'Extra Election {i}',
+                start_at=election.start_at,
+                end_at=election.end_at
+            )
+        
+        with CaptureQueriesContext(connection) as several:
+            response = user_client.get(ELECTION_LIST_URL)
+        
+        assert len(response.data['results']) == 4
+        assert len(several.captured_queries) == len(single.captured_queries)
+    
+    def test_list_elections_has_voted(self, user_client, user, election, active_election, position, candidate1):
+        """Test that has_voted reflects the current user's votes."""
+        Vote(
+            election=election,
+            position=position,
+            candidate=candidate1,
+            voter_user=user
+        ).save(validate=False)
+        
+        response = user_client.get(ELECTION_LIST_URL)
+        
+        assert response.status_code == status.HTTP_200_OK
+        has_voted = {row['id']: row['has_voted'] for row in response.data['results']}
+        assert has_voted[election.id] is True
+        assert has_voted[active_election.id] is False
+    
+    def test_list_elections_scopes_vote_lookup_to_page(self, user_client, election):
+        """Test that has_voted only looks up the serialized elections."""
+        with CaptureQueriesContext(connection) as queries:
+            user_client.get(ELECTION_LIST_URL)
+        
+        vote_lookups = [
+            query['sql'] for query in queries.captured_queries
+            if '"votes"."user_id" =' in query['sql']
+        ]
+        assert len(vote_lookups) == 1
+        assert f'"votes"."election_id" IN ({election.id})' in vote_lookups[0]
+    
+    def test_list_elections_voter_turnout(self, user_client, user, member, election, position, candidate1):
+        """Test that turnout counts the owner and approved members."""
+        Vote(
+            election=election,
+            position=position,
+            candidate=candidate1,
+            voter_user=user
+        ).save(validate=False)
+        
+        response = user_client.get(ELECTION_LIST_URL)
+        
+        assert response.status_code == status.HTTP_200_OK
+        row = next(r for r in response.data['results'] if r['id'] == election.id)
+        assert row['total_votes'] == 1
+        assert row['voter_turnout'] == 50.0
+    
+    def test_list_private_results_visibility(self, api_client, another_user, member, organization):
+        """Test that members can see private results of completed elections."""
+        completed = Election.objects.create(
+            organization=organization,
+            title='Private Election',
+            start_at=timezone.now() - timedelta(days=8),
+            end_at=timezone.now() - timedelta(days=1),
+            status=ElectionStatus.COMPLETED,
+            result_visibility='private'
+        )
+        
+        api_client.force_authenticate(user=another_user)
+        response = api_client.get(ELECTION_LIST_URL)
+        
+        assert response.status_code == status.HTTP_200_OK
+        row = next(r for r in response.data['results'] if r['id'] == completed.id)
+        assert row['can_view_results'] is True
+    
+    def test_serialize_election_without_annotations(self, election, position):
+        """Test that elections loaded outside the viewset still serialize."""
+        data = ElectionSerializer(Election.objects.get(pk=election.pk)).data
+        
+        assert data['positions_count'] == 1
+        assert data['total_votes'] == 0
+        assert data['voter_turnout'] == 0
+    
+    def test_retrieve_election(self, user_client, election):
         """Test retrieving election details."""
-        api_client.force_authenticate(user=user)
         url = reverse('elections:election-detail', kwargs={'pk': election.pk})
         
-        response = api_client.get(url)
+        response = user_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         assert response.data['title'] == election.title
     
-    def test_update_election(self, api_client, user, election):
+    def test_retrieve_ongoing_election_skips_tallies(self, user_client, active_election):
+        """Test that tallies are not aggregated before results are shown."""
+        url = reverse('elections:election-detail', kwargs={'pk': active_election.pk})
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = user_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        # The tally query is the only one grouping votes by candidate
+        assert not any(
+            '"votes"."candidate_id"' in query['sql']
+            for query in queries.captured_queries
+        )
+    
+    def test_retrieve_completed_election_tallies(self, user_client, user, organization):
+        """Test that completed election details include candidate tallies."""
+        completed = Election.objects.create(
+            organization=organization,
+            title='Completed Election',
+            start_at=timezone.now() - timedelta(days=8),
+            end_at=timezone.now() - timedelta(days=1),
+            status=ElectionStatus.COMPLETED
+        )
+        position = Position.objects.create(election=completed, title='President')
+        winner = Candidate.objects.create(position=position, name='Winner')
+        runner_up = Candidate.objects.create(position=position, name='Runner Up')
+        for candidate in (winner, winner, winner, runner_up):
+            Vote(
+                election=completed,
+                position=position,
+                candidate=candidate,
+                voter_user=user
+            ).save(validate=False)
+        
+        url = reverse('elections:election-detail', kwargs={'pk': completed.pk})
+        
+        response = user_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        position_data = response.data['positions'][0]
+        assert position_data['total_votes'] == 4
+        candidates = {c['name']: c for c in position_data['candidates']}
+        assert candidates['Winner']['vote_count'] == 3
+        assert candidates['Winner']['vote_percentage'] == 75.0
+        assert candidates['Runner Up']['vote_count'] == 1
+    
+    def test_update_election(self, user_client, election):
         """Test updating election."""
-        api_client.force_authenticate(user=user)
         url = reverse('elections:election-detail', kwargs={'pk': election.pk})
         data = {'description': 'Updated description'}
         
-        response = api_client.patch(url, data, format='json')
+        response = user_client.patch(url, data, format='json')
         
         assert response.status_code == status.HTTP_200_OK
         election.refresh_from_db()
         assert election.description == 'Updated description'
     
-    def test_delete_election(self, api_client, user, election):
+    def test_update_election_end_before_start(self, user_client, election):
+        """Test that partial updates are validated against stored dates."""
+        url = reverse('elections:election-detail', kwargs={'pk': election.pk})
+        data = {'end_at': (election.start_at - timedelta(hours=1)).isoformat()}
+        
+        response = user_client.patch(url, data, format='json')
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    def test_delete_election(self, user_client, election):
         """Test deleting election."""
-        api_client.force_authenticate(user=user)
         url = reverse('elections:election-detail', kwargs={'pk': election.pk})
         
-        response = api_client.delete(url)
+        response = user_client.delete(url)
         
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not Election.objects.filter(id=election.id).exists()
@@ -216,58 +368,66 @@ class TestElectionCRUD:
 class TestElectionFilters:
     """Test election filtering."""
     
-    def test_get_active_elections(self, api_client, user, active_election):
+    def test_get_active_elections(self, user_client, active_election):
         """Test getting active elections."""
-        api_client.force_authenticate(user=user)
-        url = reverse('elections:election-active')
-        
-        response = api_client.get(url)
+        response = user_client.get(ELECTION_ACTIVE_URL)
         
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) >= 1
+        assert len(response.data['results']) >= 1
     
-    def test_get_upcoming_elections(self, api_client, user, election):
+    def test_get_upcoming_elections(self, user_client, election):
         """Test getting upcoming elections."""
-        api_client.force_authenticate(user=user)
-        url = reverse('elections:election-upcoming')
-        
-        response = api_client.get(url)
+        response = user_client.get(ELECTION_UPCOMING_URL)
         
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) >= 1
+        assert len(response.data['results']) >= 1
     
-    def test_get_by_organization(self, api_client, user, election, organization):
+    def test_get_by_organization(self, user_client, election, organization):
         """Test getting elections by organization."""
-        api_client.force_authenticate(user=user)
-        url = reverse('elections:election-by-organization')
-        
-        response = api_client.get(url, {'organization_slug': organization.slug})
+        response = user_client.get(ELECTION_BY_ORGANIZATION_URL, {'organization_slug': organization.slug})
         
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) >= 1
+        assert len(response.data['results']) >= 1
+    
+    def test_pages_are_stable_for_tied_created_at(self, user_client, organization, election):
+        """Test that elections sharing created_at are neither repeated nor skipped."""
+        Election.objects.bulk_create(
+            Election(
+                organization=organization,
+                title=f'Tied Election {i}',
+                start_at=election.start_at,
+                end_at=election.end_at
+            )
+            for i in range(10)
+        )
+        Election.objects.update(created_at=election.created_at)
+        
+        first = user_client.get(ELECTION_LIST_URL)
+        second = user_client.get(ELECTION_LIST_URL, {'page': 2})
+        
+        ids = [row['id'] for row in first.data['results'] + second.data['results']]
+        assert sorted(ids) == sorted(Election.objects.values_list('id', flat=True))
 
 
 @pytest.mark.django_db
 class TestElectionControl:
     """Test election start/end controls."""
     
-    def test_start_election(self, api_client, user, election):
+    def test_start_election(self, user_client, election):
         """Test manually starting an election."""
-        api_client.force_authenticate(user=user)
         url = reverse('elections:election-start', kwargs={'pk': election.pk})
         
-        response = api_client.post(url)
+        response = user_client.post(url)
         
         assert response.status_code == status.HTTP_200_OK
         election.refresh_from_db()
         assert election.status == ElectionStatus.ONGOING
     
-    def test_end_election(self, api_client, user, active_election):
+    def test_end_election(self, user_client, active_election):
         """Test manually ending an election."""
-        api_client.force_authenticate(user=user)
         url = reverse('elections:election-end', kwargs={'pk': active_election.pk})
         
-        response = api_client.post(url)
+        response = user_client.post(url)
         
         assert response.status_code == status.HTTP_200_OK
         active_election.refresh_from_db()
@@ -278,10 +438,8 @@ class TestElectionControl:
 class TestPositionCRUD:
     """Test position CRUD operations."""
     
-    def test_create_position(self, api_client, user, election):
+    def test_create_position(self, user_client, election):
         """Test creating a position."""
-        api_client.force_authenticate(user=user)
-        url = reverse('elections:position-list')
         data = {
             'election': election.id,
             'title': 'Vice President',
@@ -289,28 +447,24 @@ class TestPositionCRUD:
             'order_index': 2
         }
         
-        response = api_client.post(url, data, format='json')
+        response = user_client.post(POSITION_LIST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
         assert Position.objects.filter(title='Vice President').exists()
     
-    def test_list_positions(self, api_client, user, position):
+    def test_list_positions(self, user_client, position):
         """Test listing positions."""
-        api_client.force_authenticate(user=user)
-        url = reverse('elections:position-list')
-        
-        response = api_client.get(url)
+        response = user_client.get(POSITION_LIST_URL)
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) >= 1
     
-    def test_update_position(self, api_client, user, position):
+    def test_update_position(self, user_client, position):
         """Test updating position."""
-        api_client.force_authenticate(user=user)
         url = reverse('elections:position-detail', kwargs={'pk': position.pk})
         data = {'description': 'Updated description'}
         
-        response = api_client.patch(url, data, format='json')
+        response = user_client.patch(url, data, format='json')
         
         assert response.status_code == status.HTTP_200_OK
         position.refresh_from_db()
@@ -321,17 +475,15 @@ class TestPositionCRUD:
 class TestCandidateCRUD:
     """Test candidate CRUD operations."""
     
-    def test_create_candidate(self, api_client, user, position):
+    def test_create_candidate(self, user_client, user, position):
         """Test creating a candidate."""
-        api_client.force_authenticate(user=user)
-        url = reverse('elections:candidate-list')
         data = {
             'position': position.id,
             'user': user.id,
             'manifesto': 'Vote for change!'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = user_client.post(CANDIDATE_LIST_URL, data, format='json')
         
         if response.status_code != 201:
             print(f"Response status: {response.status_code}")
@@ -340,37 +492,106 @@ class TestCandidateCRUD:
         assert response.status_code == status.HTTP_201_CREATED
         assert Candidate.objects.filter(user=user, position=position).exists()
     
-    def test_create_external_candidate(self, api_client, user, position):
+    def test_create_external_candidate(self, user_client, position):
         """Test creating an external candidate."""
-        api_client.force_authenticate(user=user)
-        url = reverse('elections:candidate-list')
         data = {
             'position': position.id,
             'name': 'External Candidate',
             'manifesto': 'External manifesto'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = user_client.post(CANDIDATE_LIST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
         assert Candidate.objects.filter(name='External Candidate').exists()
     
-    def test_list_candidates(self, api_client, user, candidate1):
-        """Test listing candidates."""
-        api_client.force_authenticate(user=user)
-        url = reverse('elections:candidate-list')
+    def test_cannot_move_candidate_to_other_organization(self, user_client, user, member, candidate2):
+        """Test that a position-only update still checks membership."""
+        other_org = Organization.objects.create(name='Other Organization', owner=user)
+        other_election = Election.objects.create(
+            organization=other_org,
+            title='Other Election',
+            start_at=timezone.now() + timedelta(days=1),
+            end_at=timezone.now() + timedelta(days=8)
+        )
+        other_position = Position.objects.create(election=other_election, title='Treasurer')
+        url = reverse('elections:candidate-detail', kwargs={'pk': candidate2.pk})
+        
+        response = user_client.patch(url, {'position': other_position.id}, format='json')
         
-        response = api_client.get(url)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        candidate2.refresh_from_db()
+        assert candidate2.position_id != other_position.id
+    
+    def test_list_candidates(self, user_client, candidate1):
+        """Test listing candidates."""
+        response = user_client.get(CANDIDATE_LIST_URL)
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) >= 1
     
-    def test_get_candidates_by_position(self, api_client, user, candidate1, position):
+    def test_get_candidates_by_position(self, user_client, candidate1, position):
         """Test getting candidates by position."""
-        api_client.force_authenticate(user=user)
-        url = reverse('elections:candidate-by-position')
-        
-        response = api_client.get(url, {'position_id': position.id})
+        response = user_client.get(CANDIDATE_BY_POSITION_URL, {'position_id': position.id})
         
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) >= 1
\ No newline at end of file
+        assert len(response.data['results']) >= 1
+    
+    def test_bulk_import_candidates(self, user, member, position):
+        """Test importing a slate of member candidates at once."""
+        candidates = Candidate.bulk_import(
+            position,
+            [user.id, member.user_id],
+            ['Owner manifesto', 'Member manifesto']
+        )
+        
+        assert [c.name for c in candidates] == [user.full_name, member.user.full_name]
+        assert position.candidates.count() == 2
+    
+    def test_bulk_import_rejects_non_members(self, position):
+        """Test that importing a non-member creates no candidates."""
+        outsider = User.objects.create_user(email='outsider@example.com', password='testpass123')
+        
+        with pytest.raises(ValidationError):
+            Candidate.bulk_import(position, [outsider.id], [''])
+        assert not position.candidates.exists()
+    
+    def test_bulk_import_rejects_mismatched_manifestos(self, user, member, position):
+        """Test that every user must come with exactly one manifesto."""
+        with pytest.raises(ValidationError):
+            Candidate.bulk_import(position, [user.id, member.user_id], ['Only one'])
+        assert not position.candidates.exists()
+    
+    def test_bulk_import_rejects_duplicate_users(self, user, position):
+        """Test that a user cannot be imported twice in one slate."""
+        with pytest.raises(ValidationError):
+            Candidate.bulk_import(position, [user.id, user.id], ['First', 'Second'])
+        assert not position.candidates.exists()
+
+
+@pytest.mark.django_db
+class TestElectionStatus:
+    """Test election status computation."""
+    
+    def test_is_active_does_not_mutate_status(self, election):
+        """Test that checking activity leaves the stored status untouched."""
+        election.start()
+        
+        assert election.is_active() is False
+        assert election.status == ElectionStatus.ONGOING
+    
+    def test_partial_save_keeps_status(self, election):
+        """Test that update_fields saves do not recompute status."""
+        election.status = ElectionStatus.ONGOING
+        election.save(update_fields=['status', 'updated_at'])
+        
+        election.refresh_from_db()
+        assert election.status == ElectionStatus.ONGOING
+    
+    def test_start_with_stale_copy_is_rejected(self, election):
+        """Test that a stale instance cannot repeat a status transition."""
+        stale = Election.objects.get(pk=election.pk)
+        
+        assert election.start() is True
+        assert stale.start() is False
+        assert stale.status == ElectionStatus.SCHEDULED
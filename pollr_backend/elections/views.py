@@ -3,19 +3,102 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
+from django.db.models import Q, F, Count, DecimalField, Prefetch
+from django.db.models.functions import Cast, Round
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from django_filters.rest_framework import DjangoFilterBackend
 
-from .models import Election, Position, Candidate
+from .models import Election, Position, Candidate, ElectionStatus
+from voting.models import Vote
 from .serializers import (
     ElectionSerializer, ElectionDetailSerializer, ElectionCreateSerializer,
     PositionSerializer, PositionDetailSerializer,
     CandidateSerializer, CandidateCreateSerializer
 )
+from organizations.models import OrganizationMember, MembershipStatus
 from organizations.permissions import IsOrganizationOwnerOrAdmin
 
 
+_READ_PERMISSIONS = (IsAuthenticated,)
+_MANAGE_PERMISSIONS = (IsAuthenticated, IsOrganizationOwnerOrAdmin)
+
+
+class OrgScopedAccessMixin:
+    """
+    Scope a viewset to organizations the user owns or belongs to.
+    
+    access_path is the lookup from the viewset's queryset model to its
+    organization. Subclasses implement build_queryset() on top of
+    get_accessible_queryset(); it runs once per request and every
+    get_queryset() caller gets a fresh clone of the result.
+    """
+    access_path = 'organization'
+    manage_actions = frozenset({'create', 'update', 'partial_update', 'destroy'})
+    
+    def initial(self, request, *args, **kwargs):
+        """Reset the cached queryset before permission checks run."""
+        self._base_queryset = None
+        super().initial(request, *args, **kwargs)
+    
+    def get_queryset(self):
+        """Return a clone of the queryset built for this request."""
+        if getattr(self, '_base_queryset', None) is None:
+            self._base_queryset = self.build_queryset()
+        return self._base_queryset.all()
+    
+    def get_accessible_queryset(self, **filters):
+        """Return rows the user can access, narrowed by the given filters."""
+        queryset = self.queryset.filter(**filters)
+        user = self.request.user
+        
+        if user.is_super_admin():
+            return queryset
+        
+        # EXISTS avoids the row fan-out (and DISTINCT) of joining members
+        return queryset.filter(
+            Q(**{f'{self.access_path}__owner': user}) |
+            OrganizationMember.approved_exists(user, self.access_path)
+        )
+    
+    def get_permissions(self):
+        """Require owner or admin rights for the managing actions."""
+        if self.action in self.manage_actions:
+            permission_classes = _MANAGE_PERMISSIONS
+        else:
+            permission_classes = _READ_PERMISSIONS
+        return [permission() for permission in permission_classes]
+
+
+class PaginatedActionMixin:
+    """Paginate list-style @action endpoints like the default list view."""
+    
+    def paginated_response(self, queryset):
+        """Serialize a page of queryset, or all of it if pagination is off."""
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+
+# Nested positions and candidates rendered by ElectionDetailSerializer
+_ELECTION_PREFETCH = (
+    Prefetch(
+        'positions',
+        queryset=Position.objects.annotate(
+            _candidates_count=Count('candidates', distinct=True)
+        ).order_by(*Position._meta.ordering).prefetch_related(
+            Prefetch(
+                'candidates',
+                queryset=Candidate.objects.select_related('user', 'position__election')
+            )
+        )
+    ),
+)
+
+
 @extend_schema_view(
     list=extend_schema(description='List elections'),
     retrieve=extend_schema(description='Retrieve election details'),
@@ -24,33 +107,95 @@ from organizations.permissions import IsOrganizationOwnerOrAdmin
     partial_update=extend_schema(description='Partially update election'),
     destroy=extend_schema(description='Delete election'),
 )
-class ElectionViewSet(viewsets.ModelViewSet):
+class ElectionViewSet(OrgScopedAccessMixin, PaginatedActionMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing elections.
     
     Organization owners and admins can create and manage elections.
     Members can view and vote in elections.
     """
+    queryset = Election.objects.all()
     serializer_class = ElectionSerializer
     permission_classes = [IsAuthenticated]
+    manage_actions = OrgScopedAccessMixin.manage_actions | {'start', 'end'}
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['status', 'organization']
     search_fields = ['title', 'description']
     ordering_fields = ['start_at', 'created_at']
     
-    def get_queryset(self):
+    def build_queryset(self, status=None):
         """Return elections based on user access."""
-        user = self.request.user
+        filters = {'status': status} if status is not None else {}
+        queryset = self.get_accessible_queryset(**filters)
         
-        if user.is_super_admin():
-            return Election.objects.all()
+        # Aggregation drops Meta.ordering, so restate it for pagination; the id
+        # tiebreak keeps pages stable when created_at values collide
+        queryset = queryset.annotate(
+            _positions_count=Count('positions', distinct=True),
+            _member_count=OrganizationMember.count_subquery(
+                'organization',
+                membership_status=MembershipStatus.APPROVED
+            ),
+            _total_votes=Vote.count_subquery('pk'),
+            _total_voters=Vote.count_subquery('pk', field='user', distinct=True),
+        ).annotate(
+            # Eligible voters are the approved members plus the owner
+            _turnout=Round(
+                Cast('_total_voters', DecimalField(max_digits=12, decimal_places=2)) * 100
+                / (F('_member_count') + 1),
+                2
+            ),
+        ).order_by(*Election._meta.ordering, '-id').select_related('organization').defer(
+            # Only the organization name and slug are serialized
+            'organization__description'
+        )
         
-        # Get elections from organizations user has access to
-        return Election.objects.filter(
-            Q(organization__owner=user) |
-            Q(organization__members__user=user, 
-              organization__members__membership_status='approved')
-        ).distinct()
+        if self.action == 'retrieve':
+            # Load nested positions and candidates up front for the detail serializer
+            queryset = queryset.prefetch_related(*_ELECTION_PREFETCH)
+        
+        return queryset
+    
+    def get_serializer(self, *args, **kwargs):
+        """Attach the vote lookups the serialized election(s) will render."""
+        if kwargs.get('many') and args and self.request.user.is_authenticated:
+            elections = list(args[0])
+            context = kwargs.setdefault('context', self.get_serializer_context())
+            context.update(self.get_row_context(elections))
+            args = (elections, *args[1:])
+        elif (
+            self.action == 'retrieve' and args
+            and args[0].status == ElectionStatus.COMPLETED
+        ):
+            # Tallies are only rendered once voting is over, so ongoing
+            # elections skip the GROUP BY over their votes
+            context = kwargs.setdefault('context', self.get_serializer_context())
+            context['tallies'], context['position_totals'] = (
+                Vote.get_tallies_for_election(args[0].pk)
+            )
+        return super().get_serializer(*args, **kwargs)
+    
+    def get_row_context(self, elections):
+        """
+        Look up has_voted and result access for just these elections.
+        
+        Two queries per page instead of an EXISTS per serialized election;
+        single elections fall back to the serializer's own lookups.
+        """
+        if not elections:
+            return {'voted_election_ids': set(), 'user_org_ids': set()}
+        
+        user = self.request.user
+        return {
+            'voted_election_ids': Vote.get_voted_election_ids(
+                user, election_ids=[election.id for election in elections]
+            ),
+            'user_org_ids': set(
+                user.get_organizations().filter(
+                    pk__in={election.organization_id for election in elections}
+                ).values_list('id', flat=True)
+            ),
+        }
     
     def get_serializer_class(self):
         """Return appropriate serializer."""
@@ -60,12 +205,6 @@ class ElectionViewSet(viewsets.ModelViewSet):
             return ElectionDetailSerializer
         return ElectionSerializer
     
-    def get_permissions(self):
-        """Set permissions based on action."""
-        if self.action in ['create', 'update', 'partial_update', 'destroy', 'start', 'end']:
-            return [IsAuthenticated(), IsOrganizationOwnerOrAdmin()]
-        return [IsAuthenticated()]
-    
     @extend_schema(
         description='Get elections for a specific organization',
         responses={200: ElectionSerializer(many=True)}
@@ -81,8 +220,7 @@ class ElectionViewSet(viewsets.ModelViewSet):
             )
         
         elections = self.get_queryset().filter(organization__slug=org_slug)
-        serializer = self.get_serializer(elections, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(elections)
     
     @extend_schema(
         description='Get active elections',
@@ -91,9 +229,8 @@ class ElectionViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def active(self, request):
         """Get all active (ongoing) elections."""
-        elections = self.get_queryset().filter(status='ongoing')
-        serializer = self.get_serializer(elections, many=True)
-        return Response(serializer.data)
+        elections = self.build_queryset(status=ElectionStatus.ONGOING)
+        return self.paginated_response(elections)
     
     @extend_schema(
         description='Get upcoming elections',
@@ -102,9 +239,8 @@ class ElectionViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def upcoming(self, request):
         """Get all upcoming (scheduled) elections."""
-        elections = self.get_queryset().filter(status='scheduled')
-        serializer = self.get_serializer(elections, many=True)
-        return Response(serializer.data)
+        elections = self.build_queryset(status=ElectionStatus.SCHEDULED)
+        return self.paginated_response(elections)
     
     @extend_schema(
         description='Get completed elections',
@@ -113,9 +249,8 @@ class ElectionViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def completed(self, request):
         """Get all completed elections."""
-        elections = self.get_queryset().filter(status='completed')
-        serializer = self.get_serializer(elections, many=True)
-        return Response(serializer.data)
+        elections = self.build_queryset(status=ElectionStatus.COMPLETED)
+        return self.paginated_response(elections)
     
     @extend_schema(
         description='Manually start an election',
@@ -126,13 +261,13 @@ class ElectionViewSet(viewsets.ModelViewSet):
         """Manually start an election."""
         election = self.get_object()
         
-        if election.status != 'scheduled':
+        # The status check is part of the UPDATE, so concurrent calls cannot race
+        if not election.start():
             return Response(
                 {'error': 'Only scheduled elections can be started.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        election.start()
         serializer = self.get_serializer(election)
         return Response(serializer.data)
     
@@ -145,13 +280,13 @@ class ElectionViewSet(viewsets.ModelViewSet):
         """Manually end an election."""
         election = self.get_object()
         
-        if election.status == 'completed':
+        # The status check is part of the UPDATE, so concurrent calls cannot race
+        if not election.end():
             return Response(
                 {'error': 'Election is already completed.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        election.end()
         serializer = self.get_serializer(election)
         return Response(serializer.data)
 
@@ -164,43 +299,41 @@ class ElectionViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(description='Partially update position'),
     destroy=extend_schema(description='Delete position'),
 )
-class PositionViewSet(viewsets.ModelViewSet):
+class PositionViewSet(OrgScopedAccessMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing election positions.
     
     Organization owners and admins can manage positions.
     """
+    queryset = Position.objects.all()
     serializer_class = PositionSerializer
     permission_classes = [IsAuthenticated]
+    access_path = 'election__organization'
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['election']
     ordering_fields = ['order_index', 'created_at']
     
-    def get_queryset(self):
+    def build_queryset(self):
         """Return positions based on user access."""
-        user = self.request.user
+        queryset = self.get_accessible_queryset().annotate(
+            _candidates_count=Count('candidates', distinct=True)
+        ).order_by(*Position._meta.ordering).select_related('election').defer(
+            'election__description'
+        )
         
-        if user.is_super_admin():
-            return Position.objects.all()
+        if self.action == 'retrieve':
+            # Prefetched candidates get their position set, so only users need joining
+            queryset = queryset.prefetch_related(
+                Prefetch('candidates', queryset=Candidate.objects.select_related('user'))
+            )
         
-        return Position.objects.filter(
-            Q(election__organization__owner=user) |
-            Q(election__organization__members__user=user,
-              election__organization__members__membership_status='approved')
-        ).distinct()
+        return queryset
     
     def get_serializer_class(self):
         """Return appropriate serializer."""
         if self.action == 'retrieve':
             return PositionDetailSerializer
         return PositionSerializer
-    
-    def get_permissions(self):
-        """Set permissions based on action."""
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
-            # Check if user can manage the election's organization
-            return [IsAuthenticated(), IsOrganizationOwnerOrAdmin()]
-        return [IsAuthenticated()]
 
 
 @extend_schema_view(
@@ -211,31 +344,27 @@ class PositionViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(description='Partially update candidate'),
     destroy=extend_schema(description='Delete candidate'),
 )
-class CandidateViewSet(viewsets.ModelViewSet):
+class CandidateViewSet(OrgScopedAccessMixin, PaginatedActionMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing candidates.
     
     Organization owners and admins can manage candidates.
     """
+    queryset = Candidate.objects.all()
     serializer_class = CandidateSerializer
     permission_classes = [IsAuthenticated]
+    access_path = 'position__election__organization'
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['position', 'user']
     search_fields = ['name', 'manifesto']
     ordering_fields = ['created_at']
     
-    def get_queryset(self):
+    def build_queryset(self):
         """Return candidates based on user access."""
-        user = self.request.user
-        
-        if user.is_super_admin():
-            return Candidate.objects.all()
-        
-        return Candidate.objects.filter(
-            Q(position__election__organization__owner=user) |
-            Q(position__election__organization__members__user=user,
-              position__election__organization__members__membership_status='approved')
-        ).distinct()
+        return self.get_accessible_queryset().select_related('position__election', 'user').defer(
+            'position__description',
+            'position__election__description'
+        )
     
     def get_serializer_class(self):
         """Return appropriate serializer."""
@@ -243,12 +372,6 @@ class CandidateViewSet(viewsets.ModelViewSet):
             return CandidateCreateSerializer
         return CandidateSerializer
     
-    def get_permissions(self):
-        """Set permissions based on action."""
-        if self.action in ['create', 'update', 'partial_update', 'destroy']:
-            return [IsAuthenticated(), IsOrganizationOwnerOrAdmin()]
-        return [IsAuthenticated()]
-    
     @extend_schema(
         description='Get candidates for a specific position',
         responses={200: CandidateSerializer(many=True)}
@@ -264,5 +387,4 @@ class CandidateViewSet(viewsets.ModelViewSet):
             )
         
         candidates = self.get_queryset().filter(position_id=position_id)
-        serializer = self.get_serializer(candidates, many=True)
-        return Response(serializer.data)
\ No newline at end of file
+        return self.paginated_response(candidates)
\ No newline at end of file
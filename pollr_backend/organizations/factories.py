@@ -0,0 +1,56 @@
+import factory
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from factory.django import DjangoModelFactory
+
+from .models import Organization, OrganizationMember, MembershipStatus, MemberRole
+
+
+class UserFactory(DjangoModelFactory):
+    """Factory for users taking part in organizations."""
+    
+    class Meta:
+        model = get_user_model()
+    
+    email = factory.Sequence(lambda n: f'factory-member{n}@example.com')
+    first_name = 'Test'
+    last_name = factory.Sequence(lambda n: f'Member {n}')
+    # Factory users never log in, so skip hashing with an unusable password
+    password = factory.LazyFunction(lambda: make_password(None))
+
+
+class OrganizationFactory(DjangoModelFactory):
+    """Factory for organizations with a fresh owner."""
+    
+    class Meta:
+        model = Organization
+    
+    name = factory.Sequence(lambda n: f'Organization {n}')
+    owner = factory.SubFactory(UserFactory)
+
+
+class OrganizationMemberFactory(DjangoModelFactory):
+    """Factory for approved voter memberships."""
+    
+    class Meta:
+        model = OrganizationMember
+    
+    user = factory.SubFactory(UserFactory)
+    organization = factory.SubFactory(OrganizationFactory)
+    role = MemberRole.VOTER
+    membership_status = MembershipStatus.APPROVED
+    
+    @classmethod
+    def bulk_create_batch(cls, size, organization, **kwargs):
+        """
+        Insert size memberships with one INSERT for users and one for members.
+        
+        For setup-only rows: save() and post_save signals are skipped.
+        """
+        users = get_user_model().objects.bulk_create(
+            UserFactory.build_batch(size)
+        )
+        return OrganizationMember.objects.bulk_create(
+            cls.build(user=user, organization=organization, **kwargs)
+            for user in users
+        )
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-14 17:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0006_merge_20251129_2254'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organizationmember',
+            index=models.Index(fields=['user', 'organization', 'membership_status'], name='organizatio_user_id_d9c287_idx'),
+        ),
+    ]
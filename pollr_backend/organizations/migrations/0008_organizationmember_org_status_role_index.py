@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-14 18:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0007_organizationmember_user_org_status_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='organizationmember',
+            name='organizatio_organiz_1f9839_idx',
+        ),
+        migrations.AddIndex(
+            model_name='organizationmember',
+            index=models.Index(fields=['organization', 'membership_status', 'role'], name='organizatio_organiz_b0379a_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-14 18:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0008_organizationmember_org_status_role_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='organizationmember',
+            name='organizatio_user_id_d9c287_idx',
+        ),
+        migrations.AlterUniqueTogether(
+            name='organizationmember',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='organizationmember',
+            index=models.Index(condition=models.Q(('membership_status', 'approved')), fields=['user', 'organization'], name='org_member_approved_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='organizationmember',
+            constraint=models.UniqueConstraint(fields=('user', 'organization'), name='org_member_user_org_uniq'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-14 18:08
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0009_organizationmember_unique_constraint_approved_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='organization',
+            name='organizatio_slug_5b8b37_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='organization',
+            name='organizatio_owner_i_0051c7_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='organizationmember',
+            name='organizatio_user_id_0ae0e0_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='organizationmember',
+            name='organizatio_members_a375d3_idx',
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-14 18:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organizations', '0010_remove_redundant_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='organization',
+            index=models.Index(fields=['-created_at'], name='organizatio_created_7f4ee3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='organizationmember',
+            index=models.Index(fields=['-created_at'], name='organizatio_created_ceb01f_idx'),
+        ),
+    ]
@@ -1,5 +1,10 @@
-from django.db import models
+import uuid
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q, Count, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.conf import settings
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 from django.core.exceptions import ValidationError
 
@@ -9,6 +14,13 @@ class OrganizationStatus(models.TextChoices):
     SUSPENDED = 'suspended', 'Suspended'
 
 
+# Path segments the organizations router serves next to <slug>/, which an
+# organization with the same slug could never be reached behind
+RESERVED_SLUGS = frozenset({
+    'members', 'my_organizations', 'joined_organizations', 'join_request',
+})
+
+
 class Organization(models.Model):
     """Organization model for managing polling organizations."""
     
@@ -35,57 +47,143 @@ class Organization(models.Model):
         db_table = 'organizations'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['slug']),
-            models.Index(fields=['owner']),
             models.Index(fields=['status']),
+            models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):
         return self.name
     
+    def clean(self):
+        """Reject slugs that collide with organization routes."""
+        if self.slug in RESERVED_SLUGS:
+            raise ValidationError({'slug': 'This slug is reserved.'})
+    
     def save(self, *args, **kwargs):
         """Auto-generate slug if not provided."""
-        if not self.slug:
-            self.slug = slugify(self.name)
-            # Ensure unique slug
-            original_slug = self.slug
-            counter = 1
-            while Organization.objects.filter(slug=self.slug).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
-        super().save(*args, **kwargs)
+        if self.slug:
+            super().save(*args, **kwargs)
+            return
+        
+        # Names without any sluggable characters would match every slug below
+        base_slug = slugify(self.name) or uuid.uuid4().hex[:8]
+        self.slug = self._next_free_slug(base_slug)
+        try:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+        except IntegrityError:
+            if not Organization.objects.filter(slug=self.slug).exists():
+                raise
+            # A concurrent save claimed the same slug first
+            self.slug = f"{self.slug}-{uuid.uuid4().hex[:8]}"
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+    
+    @classmethod
+    def _next_free_slug(cls, base_slug):
+        """Return base_slug, or base_slug-N with the lowest unused N."""
+        prefix = base_slug + '-'
+        taken = set()
+        if base_slug in RESERVED_SLUGS:
+            taken.add(0)
+        for slug in cls.objects.filter(
+            slug__startswith=base_slug
+        ).values_list('slug', flat=True):
+            if slug == base_slug:
+                taken.add(0)
+            elif slug.startswith(prefix) and slug[len(prefix):].isdecimal():
+                taken.add(int(slug[len(prefix):]))
+        
+        if 0 not in taken:
+            return base_slug
+        
+        # Suffixes are compared as ints, so only the winning slug is formatted
+        counter = 1
+        while counter in taken:
+            counter += 1
+        return '%s-%d' % (base_slug, counter)
+    
+    @cached_property
+    def _membership_counts(self):
+        """Approved member and admin counts from a single aggregate query."""
+        approved = Q(membership_status=MembershipStatus.APPROVED)
+        return self.members.aggregate(
+            members=Count('pk', filter=approved),
+            admins=Count('pk', filter=approved & Q(role=MemberRole.ADMIN))
+        )
     
     def get_member_count(self):
         """Get total approved members count."""
-        return self.members.filter(membership_status=MembershipStatus.APPROVED).count()
+        if hasattr(self, '_member_count'):
+            return self._member_count
+        return self._membership_counts['members']
     
     def get_admin_count(self):
         """Get total admin count."""
-        return self.members.filter(
-            membership_status=MembershipStatus.APPROVED,
-            role=MemberRole.ADMIN
-        ).count()
+        if hasattr(self, '_admin_count'):
+            return self._admin_count
+        return self._membership_counts['admins']
+    
+    def get_statistics(self):
+        """Membership and election counts from one aggregate per relation."""
+        from elections.models import ElectionStatus
+        
+        approved = Q(membership_status=MembershipStatus.APPROVED)
+        stats = self.members.aggregate(
+            total_members=Count('pk'),
+            approved_members=Count('pk', filter=approved),
+            pending_members=Count('pk', filter=Q(membership_status=MembershipStatus.PENDING)),
+            rejected_members=Count('pk', filter=Q(membership_status=MembershipStatus.REJECTED)),
+            admin_count=Count('pk', filter=approved & Q(role=MemberRole.ADMIN)),
+            voter_count=Count('pk', filter=approved & Q(role=MemberRole.VOTER)),
+        )
+        stats.update(self.elections.aggregate(
+            total_elections=Count('pk'),
+            active_elections=Count('pk', filter=Q(status=ElectionStatus.ONGOING)),
+        ))
+        return stats
+    
+    def _approved_role(self, user):
+        """
+        Role of user's approved membership, or None if there is none.
+        
+        Memoized per user on the instance, so the permission, serializer and
+        model checks of one request share a single query. Saving a
+        membership through its instance methods or calling refresh_from_db()
+        clears the memo; the queryset bulk_* UPDATEs cannot, so refresh
+        long-lived instances after them.
+        """
+        roles = self.__dict__.setdefault('_approved_roles', {})
+        if user.id not in roles:
+            roles[user.id] = self.members.filter(
+                user=user,
+                membership_status=MembershipStatus.APPROVED
+            ).values_list('role', flat=True).first()
+        return roles[user.id]
+    
+    def clear_membership_cache(self):
+        """Forget memoized membership roles and counts."""
+        self.__dict__.pop('_approved_roles', None)
+        self.__dict__.pop('_membership_counts', None)
+    
+    def refresh_from_db(self, *args, **kwargs):
+        """Reload fields and drop membership lookups memoized on the instance."""
+        super().refresh_from_db(*args, **kwargs)
+        self.clear_membership_cache()
     
     def is_member(self, user):
         """Check if user is an approved member."""
-        return self.members.filter(
-            user=user,
-            membership_status=MembershipStatus.APPROVED
-        ).exists()
+        return self._approved_role(user) is not None
     
     def is_admin(self, user):
         """Check if user is an admin of this organization."""
-        if self.owner == user:
+        if self.owner_id == user.id:
             return True
-        return self.members.filter(
-            user=user,
-            role=MemberRole.ADMIN,
-            membership_status=MembershipStatus.APPROVED
-        ).exists()
+        return self._approved_role(user) == MemberRole.ADMIN
     
     def can_manage(self, user):
         """Check if user can manage this organization."""
-        return user.is_super_admin() or self.owner == user or self.is_admin(user)
+        return user.is_super_admin() or self.owner_id == user.id or self.is_admin(user)
     
     def suspend(self):
         """Suspend the organization."""
@@ -109,6 +207,61 @@ class MemberRole(models.TextChoices):
     VOTER = 'voter', 'Voter'
 
 
+class OrganizationMemberQuerySet(models.QuerySet):
+    """
+    Membership loading and bulk transitions.
+    
+    for_serializer() narrows the columns OrganizationMemberSerializer
+    reads. Each bulk_* method is a single UPDATE and skips save(); clean()
+    only rejects owner memberships, which a status or role change cannot
+    create.
+    """
+    
+    def for_serializer(self):
+        """
+        Join the related rows OrganizationMemberSerializer renders.
+        
+        Only the related columns it reads are fetched, plus the owner needed
+        by the member permissions, instead of every User/Organization column.
+        """
+        return self.select_related('user', 'organization', 'invited_by').only(
+            'id', 'user', 'organization', 'role', 'membership_status',
+            'invited_by', 'created_at', 'updated_at',
+            'user__email', 'user__first_name', 'user__last_name',
+            'organization__name', 'organization__owner',
+            'invited_by__email',
+        )
+    
+    def _check_filtered(self):
+        """Refuse to transition every membership, e.g. objects.bulk_approve()."""
+        if not self.query.has_filters():
+            raise ValueError('Bulk membership transitions need a filtered queryset.')
+    
+    def _transition(self, **values):
+        """Write values and a fresh updated_at to every row in one UPDATE."""
+        self._check_filtered()
+        return self.update(updated_at=timezone.now(), **values)
+    
+    def bulk_approve(self):
+        """Approve the membership requests."""
+        return self._transition(membership_status=MembershipStatus.APPROVED)
+    
+    def bulk_reject(self):
+        """Reject the membership requests."""
+        return self._transition(membership_status=MembershipStatus.REJECTED)
+    
+    def bulk_promote_to_admin(self):
+        """Promote the approved members to admin, skipping the others."""
+        self._check_filtered()
+        return self.filter(
+            membership_status=MembershipStatus.APPROVED
+        )._transition(role=MemberRole.ADMIN)
+    
+    def bulk_demote_to_voter(self):
+        """Demote the members to voter."""
+        return self._transition(role=MemberRole.VOTER)
+
+
 class OrganizationMember(models.Model):
     """Organization membership model."""
     
@@ -144,14 +297,26 @@ class OrganizationMember(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = OrganizationMemberQuerySet.as_manager()
+    
     class Meta:
         db_table = 'organization_members'
         ordering = ['-created_at']
-        unique_together = [['user', 'organization']]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['user', 'organization'],
+                name='org_member_user_org_uniq'
+            ),
+        ]
         indexes = [
-            models.Index(fields=['user', 'organization']),
-            models.Index(fields=['organization', 'membership_status']),
-            models.Index(fields=['membership_status']),
+            # Access checks only ever look for approved memberships
+            models.Index(
+                fields=['user', 'organization'],
+                condition=Q(membership_status=MembershipStatus.APPROVED),
+                name='org_member_approved_idx'
+            ),
+            models.Index(fields=['organization', 'membership_status', 'role']),
+            models.Index(fields=['-created_at']),
         ]
     
     def __str__(self):
@@ -160,15 +325,50 @@ class OrganizationMember(models.Model):
     def clean(self):
         """Validate membership."""
         # Check if user is organization owner
-        if self.user == self.organization.owner:
+        if self.user_id == self.organization.owner_id:
             raise ValidationError(
                 "Organization owner cannot be added as a member. They have full access by default."
             )
     
+    @classmethod
+    def approved_exists(cls, user, organization_ref, **filters):
+        """
+        Correlated EXISTS of an approved membership of user.
+        
+        Filtering on this instead of joining members avoids the row fan-out
+        that would otherwise need a DISTINCT. Extra filters narrow the
+        membership, e.g. role=MemberRole.ADMIN.
+        """
+        return Exists(
+            cls.objects.filter(
+                organization=OuterRef(organization_ref),
+                user=user,
+                membership_status=MembershipStatus.APPROVED,
+                **filters
+            )
+        )
+    
+    @classmethod
+    def count_subquery(cls, organization_ref, **filters):
+        """
+        Correlated COUNT of memberships for annotating another queryset.
+        
+        organization_ref names the outer field holding the organization,
+        e.g. 'pk' on Organization or 'organization' on Election.
+        """
+        counts = cls.objects.filter(
+            organization=OuterRef(organization_ref),
+            **filters
+        ).order_by().values('organization').annotate(
+            count=Count('pk')
+        ).values('count')
+        return Coalesce(Subquery(counts), 0)
+    
     def save(self, *args, **kwargs):
-        """Override save to validate."""
-        self.clean()
+        """Save and drop the organization's now stale membership memo."""
         super().save(*args, **kwargs)
+        if OrganizationMember.organization.is_cached(self):
+            self.organization.clear_membership_cache()
     
     def approve(self):
         """Approve membership request."""
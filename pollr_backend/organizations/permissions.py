@@ -26,9 +26,14 @@ class IsOrganizationOwnerOrAdmin(permissions.BasePermission):
             organization = obj
         
         # Organization owner has full access
-        if organization.owner == request.user:
+        if organization.owner_id == request.user.id:
             return True
         
+        # Reuse the requesting user's admin flag when the viewset annotated it
+        is_admin = getattr(organization, '_is_admin', None)
+        if is_admin is not None:
+            return is_admin
+        
         # Check if user is an admin member
         return organization.is_admin(request.user)
 
@@ -44,9 +49,13 @@ class IsOrganizationMember(permissions.BasePermission):
             return True
         
         # Owner has access
-        if obj.owner == request.user:
+        if obj.owner_id == request.user.id:
             return True
         
+        is_member = getattr(obj, '_is_member', None)
+        if is_member is not None:
+            return is_member
+        
         # Check if user is an approved member
         return obj.is_member(request.user)
 
@@ -70,7 +79,7 @@ class CanManageMembers(permissions.BasePermission):
             return True
         
         # Organization owner can manage
-        if organization.owner == request.user:
+        if organization.owner_id == request.user.id:
             return True
         
         # Organization admins can manage
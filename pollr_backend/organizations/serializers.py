@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.utils.functional import cached_property
 from .models import Organization, OrganizationMember, MembershipStatus, MemberRole
 
 User = get_user_model()
@@ -34,26 +35,36 @@ class OrganizationSerializer(serializers.ModelSerializer):
         """Get admin count."""
         return obj.get_admin_count()
     
-    def get_is_owner(self, obj):
-        """Check if current user is owner."""
+    @cached_property
+    def _request_user(self):
+        """Authenticated requesting user, resolved once for every row."""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            return obj.owner == request.user
-        return False
+            return request.user
+        return None
+    
+    def get_is_owner(self, obj):
+        """Check if current user is owner."""
+        user = self._request_user
+        return user is not None and obj.owner_id == user.id
     
     def get_is_admin(self, obj):
         """Check if current user is admin."""
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return obj.is_admin(request.user)
-        return False
+        user = self._request_user
+        if user is None:
+            return False
+        if hasattr(obj, '_is_admin'):
+            return obj.owner_id == user.id or obj._is_admin
+        return obj.is_admin(user)
     
     def get_is_member(self, obj):
         """Check if current user is member."""
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return obj.is_member(request.user)
-        return False
+        user = self._request_user
+        if user is None:
+            return False
+        if hasattr(obj, '_is_member'):
+            return obj._is_member
+        return obj.is_member(user)
     
     def create(self, validated_data):
         """Create organization with current user as owner."""
@@ -72,7 +83,11 @@ class OrganizationDetailSerializer(OrganizationSerializer):
     
     def get_members(self, obj):
         """Get approved members only."""
-        members = obj.members.filter(membership_status=MembershipStatus.APPROVED)
+        members = getattr(obj, 'approved_members', None)
+        if members is None:
+            members = obj.members.filter(
+                membership_status=MembershipStatus.APPROVED
+            ).for_serializer()
         return OrganizationMemberSerializer(members, many=True).data
 
 
@@ -92,6 +107,17 @@ class OrganizationMemberSerializer(serializers.ModelSerializer):
             'invited_by', 'invited_by_email', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'invited_by', 'created_at', 'updated_at']
+    
+    def validate(self, attrs):
+        """Prevent the organization owner from becoming a member."""
+        user = attrs.get('user') or getattr(self.instance, 'user', None)
+        organization = attrs.get('organization') or getattr(self.instance, 'organization', None)
+        if user and organization and organization.owner_id == user.id:
+            raise serializers.ValidationError(
+                "Organization owner cannot be added as a member. They have full access by default."
+            )
+        
+        return attrs
 
 
 class MembershipRequestSerializer(serializers.Serializer):
@@ -106,7 +132,8 @@ class MembershipRequestSerializer(serializers.Serializer):
     def validate_user_email(self, value):
         """Validate that user exists."""
         try:
-            User.objects.get(email=value)
+            # Kept for validate() so the user is only fetched once
+            self._user = User.objects.get(email=value)
         except User.DoesNotExist:
             raise serializers.ValidationError("User with this email does not exist.")
         return value
@@ -114,18 +141,18 @@ class MembershipRequestSerializer(serializers.Serializer):
     def validate(self, attrs):
         """Validate membership request."""
         organization = self.context.get('organization')
-        user = User.objects.get(email=attrs['user_email'])
+        user = self._user
         
         # Check if user is the owner
-        if organization.owner == user:
+        if organization.owner_id == user.id:
             raise serializers.ValidationError(
                 "Cannot add organization owner as a member. They have full access."
             )
         
         # Check if membership already exists
         if OrganizationMember.objects.filter(
-            user=user,
-            organization=organization
+            user_id=user.id,
+            organization_id=organization.id
         ).exists():
             raise serializers.ValidationError(
                 "User is already a member or has a pending request."
@@ -143,10 +170,16 @@ class MembershipJoinSerializer(serializers.Serializer):
     def validate_organization_slug(self, value):
         """Validate organization exists."""
         try:
-            Organization.objects.get(slug=value)
+            # Kept for validate() so the view does not fetch it again
+            self._organization = Organization.objects.get(slug=value)
         except Organization.DoesNotExist:
             raise serializers.ValidationError("Organization not found.")
         return value
+    
+    def validate(self, attrs):
+        """Expose the organization looked up by slug."""
+        attrs['organization'] = self._organization
+        return attrs
 
 
 class MembershipActionSerializer(serializers.Serializer):
@@ -155,6 +188,15 @@ class MembershipActionSerializer(serializers.Serializer):
     action = serializers.ChoiceField(choices=['approve', 'reject'])
 
 
+class BulkMembershipActionSerializer(MembershipActionSerializer):
+    """Serializer for approving or rejecting several membership requests."""
+    
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False
+    )
+
+
 class MemberRoleUpdateSerializer(serializers.Serializer):
     """Serializer for updating member role."""
     
@@ -1,4 +1,7 @@
 import pytest
+from functools import lru_cache
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -7,9 +10,37 @@ from .models import (
     Organization, OrganizationMember, 
     MembershipStatus, MemberRole, OrganizationStatus
 )
+from .factories import OrganizationMemberFactory
+from .views import OrganizationViewSet
 
 User = get_user_model()
 
+ORGANIZATION_LIST_URL = reverse('organizations:organization-list')
+MY_ORGANIZATIONS_URL = reverse('organizations:organization-my-organizations')
+JOINED_ORGANIZATIONS_URL = reverse('organizations:organization-joined-organizations')
+JOIN_REQUEST_URL = reverse('organizations:organization-join-request')
+MEMBER_LIST_URL = reverse('organizations:member-list')
+MEMBER_PENDING_URL = reverse('organizations:member-pending')
+MEMBER_BULK_REVIEW_URL = reverse('organizations:member-bulk-review')
+
+
+@lru_cache(maxsize=None)
+def organization_url(action, slug):
+    """Reverse an organization route once per action and slug."""
+    return reverse(f'organizations:organization-{action}', kwargs={'slug': slug})
+
+
+# Queries each endpoint may run; raise only with a reason, never for N+1s
+QUERY_BUDGETS = {
+    'list_organizations': 2,  # page count, page rows
+    'retrieve_organization': 2,  # organization, approved members
+    'list_pending_requests': 1,
+    'get_statistics': 3,  # organization, member and election aggregates
+    'approve_membership': 2,  # membership with related rows, status UPDATE
+    'invite_member': 4,  # organization, invitee, duplicate check, INSERT
+    'join_request': 4,  # organization, INSERT inside a savepoint
+}
+
 
 @pytest.fixture
 def api_client():
@@ -79,13 +110,12 @@ class TestOrganizationCRUD:
     def test_create_organization(self, api_client, regular_user):
         """Test creating an organization."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:organization-list')
         data = {
             'name': 'New Organization',
             'description': 'A new organization'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(ORGANIZATION_LIST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
         assert Organization.objects.filter(name='New Organization').exists()
@@ -93,31 +123,89 @@ class TestOrganizationCRUD:
         assert org.owner == regular_user
         assert org.slug == 'new-organization'
     
-    def test_list_organizations(self, api_client, regular_user, organization):
+    def test_list_organizations(self, api_client, regular_user, organization, django_assert_num_queries):
         """Test listing organizations."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:organization-list')
         
-        response = api_client.get(url)
+        with django_assert_num_queries(QUERY_BUDGETS['list_organizations']):
+            response = api_client.get(ORGANIZATION_LIST_URL)
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) >= 1
     
-    def test_retrieve_organization(self, api_client, regular_user, organization):
+    def test_list_organizations_query_count(self, api_client, regular_user, another_user, organization):
+        """Test that listing organizations does not run queries per row."""
+        api_client.force_authenticate(user=another_user)
+        OrganizationMember.objects.create(
+            user=another_user,
+            organization=organization,
+            role=MemberRole.ADMIN,
+            membership_status=MembershipStatus.APPROVED
+        )
+        
+        with CaptureQueriesContext(connection) as single:
+            api_client.get(ORGANIZATION_LIST_URL)
+        
+        for i in range(3):
+            extra = Organization.objects.create(name=f'Extra {i}', owner=regular_user)
+            OrganizationMember.objects.create(
+                user=another_user,
+                organization=extra,
+                membership_status=MembershipStatus.APPROVED
+            )
+        
+        with CaptureQueriesContext(connection) as several:
+            response = api_client.get(ORGANIZATION_LIST_URL)
+        
+        rows = {row['slug']: row for row in response.data['results']}
+        assert len(rows) == 4
+        assert rows[organization.slug]['is_admin'] is True
+        assert rows[organization.slug]['member_count'] == 1
+        assert rows['extra-0']['is_admin'] is False
+        assert rows['extra-0']['is_member'] is True
+        assert len(several.captured_queries) == len(single.captured_queries)
+    
+    def test_retrieve_organization(self, api_client, regular_user, organization, django_assert_num_queries):
         """Test retrieving organization details."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:organization-detail', kwargs={'slug': organization.slug})
+        url = organization_url('detail', organization.slug)
         
-        response = api_client.get(url)
+        with django_assert_num_queries(QUERY_BUDGETS['retrieve_organization']):
+            response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         assert response.data['name'] == organization.name
         assert response.data['is_owner'] is True
     
+    def test_retrieve_organization_members_query_count(self, api_client, regular_user, organization):
+        """Test that the member list does not run queries per member."""
+        api_client.force_authenticate(user=regular_user)
+        url = organization_url('detail', organization.slug)
+        
+        def add_member(email):
+            OrganizationMember.objects.create(
+                user=User.objects.create_user(email=email),
+                organization=organization,
+                membership_status=MembershipStatus.APPROVED,
+                invited_by=regular_user
+            )
+        
+        add_member('first@example.com')
+        with CaptureQueriesContext(connection) as single:
+            api_client.get(url)
+        
+        add_member('second@example.com')
+        add_member('third@example.com')
+        with CaptureQueriesContext(connection) as several:
+            response = api_client.get(url)
+        
+        assert len(response.data['members']) == 3
+        assert len(several.captured_queries) == len(single.captured_queries)
+    
     def test_update_organization(self, api_client, regular_user, organization):
         """Test updating organization."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:organization-detail', kwargs={'slug': organization.slug})
+        url = organization_url('detail', organization.slug)
         data = {'description': 'Updated description'}
         
         response = api_client.patch(url, data, format='json')
@@ -129,7 +217,7 @@ class TestOrganizationCRUD:
     def test_non_owner_cannot_update(self, api_client, another_user, organization):
         """Test that non-owners cannot update organization."""
         api_client.force_authenticate(user=another_user)
-        url = reverse('organizations:organization-detail', kwargs={'slug': organization.slug})
+        url = organization_url('detail', organization.slug)
         data = {'description': 'Hacker description'}
         
         response = api_client.patch(url, data, format='json')
@@ -139,7 +227,7 @@ class TestOrganizationCRUD:
     def test_delete_organization(self, api_client, regular_user, organization):
         """Test deleting organization."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:organization-detail', kwargs={'slug': organization.slug})
+        url = organization_url('detail', organization.slug)
         
         response = api_client.delete(url)
         
@@ -159,6 +247,45 @@ class TestOrganizationCRUD:
         )
         
         assert org2.slug == 'same-name-1'
+    
+    def test_slug_generation_skips_taken_suffixes(self, regular_user):
+        """Test that slug suffixes ignore unrelated prefixed slugs."""
+        for slug in ['club', 'club-1', 'club-house']:
+            Organization.objects.create(name='Club', slug=slug, owner=regular_user)
+        
+        org = Organization.objects.create(name='Club', owner=regular_user)
+        
+        assert org.slug == 'club-2'
+    
+    def test_slug_generation_without_sluggable_name(self, regular_user):
+        """Test that names with no sluggable characters still get a slug."""
+        first = Organization.objects.create(name='!!!', owner=regular_user)
+        second = Organization.objects.create(name='???', owner=regular_user)
+        
+        assert first.slug
+        assert second.slug
+        assert first.slug != second.slug
+    
+    def test_save_integrity_error_not_treated_as_slug_race(self):
+        """Test that integrity errors unrelated to the slug are raised."""
+        orphan = Organization(name='Orphan')
+        
+        with pytest.raises(IntegrityError):
+            orphan.save()
+        
+        # A slug race would have retried with a random suffix
+        assert orphan.slug == 'orphan'
+    
+    def test_slug_generation_skips_reserved_routes(self, api_client, regular_user):
+        """Test that an organization named like a route stays reachable."""
+        api_client.force_authenticate(user=regular_user)
+        org = Organization.objects.create(name='Members', owner=regular_user)
+        
+        response = api_client.get(organization_url('detail', org.slug))
+        
+        assert org.slug == 'members-1'
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['name'] == 'Members'
 
 
 @pytest.mark.django_db
@@ -169,40 +296,92 @@ class TestOrganizationOwnership:
         """Test getting user's owned organizations."""
         api_client.force_authenticate(user=regular_user)
         
-        # Create multiple organizations
-        Organization.objects.create(name='Org 1', owner=regular_user)
-        Organization.objects.create(name='Org 2', owner=regular_user)
+        # Create multiple organizations; bulk_create skips save(), so set slugs
+        Organization.objects.bulk_create([
+            Organization(name='Org 1', slug='org-1', owner=regular_user),
+            Organization(name='Org 2', slug='org-2', owner=regular_user),
+        ])
         
-        url = reverse('organizations:organization-my-organizations')
-        response = api_client.get(url)
+        response = api_client.get(MY_ORGANIZATIONS_URL)
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 2
     
+    def test_my_organizations_spans_iterator_chunks(
+        self, api_client, regular_user, monkeypatch
+    ):
+        """Test that streamed organizations are all returned across chunks."""
+        api_client.force_authenticate(user=regular_user)
+        monkeypatch.setattr(OrganizationViewSet, 'iterator_chunk_size', 2)
+        Organization.objects.bulk_create(
+            Organization(name=f'Org {i}', slug=f'org-{i}', owner=regular_user)
+            for i in range(5)
+        )
+        
+        response = api_client.get(MY_ORGANIZATIONS_URL)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(org['slug'] for org in response.data) == [
+            f'org-{i}' for i in range(5)
+        ]
+    
     def test_joined_organizations(self, api_client, regular_user, organization):
         """Test getting organizations where user is a member."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:organization-joined-organizations')
         
-        response = api_client.get(url)
+        response = api_client.get(JOINED_ORGANIZATIONS_URL)
         
         assert response.status_code == status.HTTP_200_OK
+    
+    def test_membership_checks_share_one_query(self, organization, another_user):
+        """Test that is_member and is_admin reuse the same lookup."""
+        OrganizationMember.objects.create(
+            user=another_user,
+            organization=organization,
+            role=MemberRole.ADMIN,
+            membership_status=MembershipStatus.APPROVED
+        )
+        
+        with CaptureQueriesContext(connection) as queries:
+            assert organization.is_member(another_user)
+            assert organization.is_admin(another_user)
+            assert organization.can_manage(another_user)
+        
+        assert len(queries.captured_queries) == 1
+    
+    def test_membership_checks_follow_membership_changes(self, organization, another_user):
+        """Test that the memoized role is dropped when the membership changes."""
+        member = OrganizationMember.objects.create(
+            user=another_user,
+            organization=organization,
+            membership_status=MembershipStatus.PENDING
+        )
+        assert not organization.is_member(another_user)
+        
+        member.approve()
+        assert organization.is_member(another_user)
+        assert not organization.is_admin(another_user)
+        
+        OrganizationMember.objects.filter(pk=member.pk).bulk_promote_to_admin()
+        organization.refresh_from_db()
+        assert organization.is_admin(another_user)
 
 
 @pytest.mark.django_db
 class TestMembershipInvitation:
     """Test membership invitation workflow."""
     
-    def test_invite_member(self, api_client, regular_user, another_user, organization):
+    def test_invite_member(self, api_client, regular_user, another_user, organization, django_assert_num_queries):
         """Test inviting a user to organization."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:organization-invite-member', kwargs={'slug': organization.slug})
+        url = organization_url('invite-member', organization.slug)
         data = {
             'user_email': another_user.email,
             'role': MemberRole.VOTER
         }
         
-        response = api_client.post(url, data, format='json')
+        with django_assert_num_queries(QUERY_BUDGETS['invite_member']):
+            response = api_client.post(url, data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
         assert OrganizationMember.objects.filter(
@@ -217,7 +396,7 @@ class TestMembershipInvitation:
     def test_cannot_invite_nonexistent_user(self, api_client, regular_user, organization):
         """Test that inviting non-existent user fails."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:organization-invite-member', kwargs={'slug': organization.slug})
+        url = organization_url('invite-member', organization.slug)
         data = {
             'user_email': 'nonexistent@example.com',
             'role': MemberRole.VOTER
@@ -230,7 +409,7 @@ class TestMembershipInvitation:
     def test_cannot_invite_owner(self, api_client, regular_user, organization):
         """Test that organization owner cannot be invited as member."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:organization-invite-member', kwargs={'slug': organization.slug})
+        url = organization_url('invite-member', organization.slug)
         data = {
             'user_email': regular_user.email,
             'role': MemberRole.VOTER
@@ -242,37 +421,24 @@ class TestMembershipInvitation:
     
     def test_non_admin_cannot_invite(self, api_client, another_user, organization):
         """Test that non-admins cannot invite members."""
-        another_user.is_superuser = False
-        another_user.is_staff = False
-        another_user.role = 'user'
-        another_user.save()
         OrganizationMember.objects.create(
             user=another_user,
             organization=organization,
             role=MemberRole.VOTER,
             membership_status=MembershipStatus.APPROVED
         )
-    
-        print(f"Is another_user admin? {organization.is_admin(another_user)}")
-        print(f"Is another_user owner? {organization.owner == another_user}")
-        print(f"Is another_user super admin? {another_user.is_super_admin()}")
+        
         # Create a valid user to invite
-        test_user = User.objects.create_user(
-            email='test@example.com',
-            password='testpass123'
-        )
+        test_user = User.objects.create_user(email='test@example.com')
     
         api_client.force_authenticate(user=another_user)
-        url = reverse('organizations:organization-invite-member', kwargs={'slug': organization.slug})
+        url = organization_url('invite-member', organization.slug)
         data = {
             'user_email': test_user.email,
             'role': MemberRole.VOTER
         }
     
         response = api_client.post(url, data, format='json')
-
-        print(f"Response status: {response.status_code}")
-        print(f"Response data: {response.data}")
     
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
@@ -281,13 +447,13 @@ class TestMembershipInvitation:
 class TestMembershipJoinRequest:
     """Test membership join request workflow."""
     
-    def test_join_request(self, api_client, another_user, organization):
+    def test_join_request(self, api_client, another_user, organization, django_assert_num_queries):
         """Test user requesting to join organization."""
         api_client.force_authenticate(user=another_user)
-        url = reverse('organizations:organization-join-request')
         data = {'organization_slug': organization.slug}
         
-        response = api_client.post(url, data, format='json')
+        with django_assert_num_queries(QUERY_BUDGETS['join_request']):
+            response = api_client.post(JOIN_REQUEST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
         assert OrganizationMember.objects.filter(
@@ -299,10 +465,9 @@ class TestMembershipJoinRequest:
     def test_owner_cannot_join_own_org(self, api_client, regular_user, organization):
         """Test that owner cannot join their own organization."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:organization-join-request')
         data = {'organization_slug': organization.slug}
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(JOIN_REQUEST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
     
@@ -316,10 +481,9 @@ class TestMembershipJoinRequest:
         )
         
         api_client.force_authenticate(user=another_user)
-        url = reverse('organizations:organization-join-request')
         data = {'organization_slug': organization.slug}
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(JOIN_REQUEST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
@@ -328,7 +492,7 @@ class TestMembershipJoinRequest:
 class TestMembershipApproval:
     """Test membership approval workflow."""
     
-    def test_approve_membership(self, api_client, regular_user, another_user, organization):
+    def test_approve_membership(self, api_client, regular_user, another_user, organization, django_assert_num_queries):
         """Test approving membership request."""
         member = OrganizationMember.objects.create(
             user=another_user,
@@ -340,9 +504,11 @@ class TestMembershipApproval:
         url = reverse('organizations:member-review', kwargs={'pk': member.pk})
         data = {'action': 'approve'}
         
-        response = api_client.post(url, data, format='json')
+        with django_assert_num_queries(QUERY_BUDGETS['approve_membership']):
+            response = api_client.post(url, data, format='json')
         
         assert response.status_code == status.HTTP_200_OK
+        assert response.data['member']['user_email'] == another_user.email
         member.refresh_from_db()
         assert member.membership_status == MembershipStatus.APPROVED
     
@@ -364,7 +530,28 @@ class TestMembershipApproval:
         member.refresh_from_db()
         assert member.membership_status == MembershipStatus.REJECTED
     
-    def test_list_pending_requests(self, api_client, regular_user, another_user, organization):
+    def test_voter_cannot_review_membership(self, api_client, another_user, organization):
+        """Test that approved voters cannot approve other requests."""
+        OrganizationMember.objects.create(
+            user=another_user,
+            organization=organization,
+            membership_status=MembershipStatus.APPROVED
+        )
+        member = OrganizationMember.objects.create(
+            user=User.objects.create_user(email='applicant@example.com'),
+            organization=organization
+        )
+        
+        api_client.force_authenticate(user=another_user)
+        url = reverse('organizations:member-review', kwargs={'pk': member.pk})
+        
+        response = api_client.post(url, {'action': 'approve'}, format='json')
+        
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        member.refresh_from_db()
+        assert member.membership_status == MembershipStatus.PENDING
+    
+    def test_list_pending_requests(self, api_client, regular_user, another_user, organization, django_assert_num_queries):
         """Test listing pending membership requests."""
         OrganizationMember.objects.create(
             user=another_user,
@@ -373,12 +560,82 @@ class TestMembershipApproval:
         )
         
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:member-pending')
         
-        response = api_client.get(url)
+        with django_assert_num_queries(QUERY_BUDGETS['list_pending_requests']):
+            response = api_client.get(MEMBER_PENDING_URL)
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) >= 1
+    
+    def test_bulk_approve_requests(self, api_client, regular_user, another_user, organization, another_organization):
+        """Test approving several requests skips other organizations."""
+        requests = [
+            OrganizationMember.objects.create(
+                user=another_user,
+                organization=organization,
+                membership_status=MembershipStatus.PENDING
+            ),
+            OrganizationMember.objects.create(
+                user=User.objects.create_user(email='third@example.com'),
+                organization=organization,
+                membership_status=MembershipStatus.PENDING
+            ),
+        ]
+        foreign = OrganizationMember.objects.create(
+            user=regular_user,
+            organization=another_organization,
+            membership_status=MembershipStatus.PENDING
+        )
+        
+        api_client.force_authenticate(user=regular_user)
+        data = {
+            'ids': [member.id for member in requests] + [foreign.id],
+            'action': 'approve'
+        }
+        
+        response = api_client.post(MEMBER_BULK_REVIEW_URL, data, format='json')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['updated'] == 2
+        for member in requests:
+            member.refresh_from_db()
+            assert member.membership_status == MembershipStatus.APPROVED
+        foreign.refresh_from_db()
+        assert foreign.membership_status == MembershipStatus.PENDING
+    
+    def test_cannot_reassign_membership_to_owner(self, api_client, regular_user, another_user, organization):
+        """Test that a membership cannot be moved onto the owner."""
+        member = OrganizationMember.objects.create(
+            user=another_user,
+            organization=organization,
+            membership_status=MembershipStatus.APPROVED
+        )
+        
+        api_client.force_authenticate(user=regular_user)
+        url = reverse('organizations:member-detail', kwargs={'pk': member.pk})
+        
+        response = api_client.patch(url, {'user': regular_user.id}, format='json')
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        member.refresh_from_db()
+        assert member.user == another_user
+    
+    def test_member_list_uses_cursor_pagination(self, api_client, regular_user, organization):
+        """Test that member pages are linked by cursor, without overlap."""
+        OrganizationMemberFactory.bulk_create_batch(12, organization=organization)
+        
+        api_client.force_authenticate(user=regular_user)
+        response = api_client.get(MEMBER_LIST_URL)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 10
+        assert 'cursor=' in response.data['next']
+        
+        next_page = api_client.get(response.data['next'])
+        
+        assert len(next_page.data['results']) == 2
+        first_ids = {member['id'] for member in response.data['results']}
+        assert first_ids.isdisjoint(member['id'] for member in next_page.data['results'])
 
 
 @pytest.mark.django_db
@@ -423,6 +680,21 @@ class TestMemberRoleManagement:
         member.refresh_from_db()
         assert member.role == MemberRole.VOTER
     
+    def test_bulk_promote_requires_filtered_queryset(self, another_user, organization):
+        """Test that bulk transitions refuse to touch every membership."""
+        member = OrganizationMember.objects.create(
+            user=another_user,
+            organization=organization,
+            membership_status=MembershipStatus.APPROVED
+        )
+        
+        with pytest.raises(ValueError):
+            OrganizationMember.objects.bulk_promote_to_admin()
+        
+        assert OrganizationMember.objects.filter(pk=member.pk).bulk_promote_to_admin() == 1
+        member.refresh_from_db()
+        assert member.role == MemberRole.ADMIN
+    
     def test_cannot_update_pending_member_role(self, api_client, regular_user, another_user, organization):
         """Test that pending members cannot have role updated."""
         member = OrganizationMember.objects.create(
@@ -466,10 +738,7 @@ class TestMemberLeaving:
         # This shouldn't exist, but testing the validation
     
         # Create a regular member first
-        another_user = User.objects.create_user(
-            email='another@example.com',
-            password='testpass123'
-        )
+        another_user = User.objects.create_user(email='another@example.com')
     
         member = OrganizationMember.objects.create(
             user=another_user,
@@ -491,7 +760,7 @@ class TestMemberLeaving:
 class TestOrganizationStatistics:
     """Test organization statistics."""
     
-    def test_get_statistics(self, api_client, regular_user, another_user, organization):
+    def test_get_statistics(self, api_client, regular_user, another_user, organization, django_assert_num_queries):
         """Test getting organization statistics."""
         # Add some members
         OrganizationMember.objects.create(
@@ -502,15 +771,48 @@ class TestOrganizationStatistics:
         )
         
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:organization-statistics', kwargs={'slug': organization.slug})
+        url = organization_url('statistics', organization.slug)
         
-        response = api_client.get(url)
+        with django_assert_num_queries(QUERY_BUDGETS['get_statistics']):
+            response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         assert 'total_members' in response.data
         assert 'approved_members' in response.data
         assert 'admin_count' in response.data
         assert response.data['approved_members'] == 1
+    
+    def test_non_member_cannot_get_statistics(self, api_client, another_user, organization):
+        """Test that statistics are limited to members."""
+        api_client.force_authenticate(user=another_user)
+        
+        response = api_client.get(organization_url('statistics', organization.slug))
+        
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+    
+    def test_statistics_counts(self, organization, another_user):
+        """Test that every statistic is counted from its own filter."""
+        OrganizationMember.objects.create(
+            user=another_user,
+            organization=organization,
+            role=MemberRole.ADMIN,
+            membership_status=MembershipStatus.APPROVED
+        )
+        OrganizationMember.objects.create(
+            user=User.objects.create_user(email='pending@example.com'),
+            organization=organization
+        )
+        
+        assert organization.get_statistics() == {
+            'total_members': 2,
+            'approved_members': 1,
+            'pending_members': 1,
+            'rejected_members': 0,
+            'admin_count': 1,
+            'voter_count': 0,
+            'total_elections': 0,
+            'active_elections': 0,
+        }
 
 
 @pytest.mark.django_db
@@ -520,7 +822,7 @@ class TestOrganizationSuspension:
     def test_suspend_organization(self, api_client, regular_user, organization):
         """Test suspending organization."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:organization-suspend', kwargs={'slug': organization.slug})
+        url = organization_url('suspend', organization.slug)
         
         response = api_client.post(url)
         
@@ -533,7 +835,7 @@ class TestOrganizationSuspension:
         organization.suspend()
         
         api_client.force_authenticate(user=regular_user)
-        url = reverse('organizations:organization-activate', kwargs={'slug': organization.slug})
+        url = organization_url('activate', organization.slug)
         
         response = api_client.post(url)
         
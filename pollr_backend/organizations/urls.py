@@ -1,13 +1,14 @@
 
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 from .views import OrganizationViewSet, OrganizationMemberViewSet
 
 app_name = 'organizations'
 
-router = DefaultRouter()
-router.register(r'', OrganizationViewSet, basename='organization')
+router = SimpleRouter()
+# Registered first so the organization slug route doesn't swallow members/
 router.register(r'members', OrganizationMemberViewSet, basename='member')
+router.register(r'', OrganizationViewSet, basename='organization')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -2,8 +2,9 @@ from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from django.shortcuts import get_object_or_404
-from django.db.models import Q, Count
+from rest_framework.pagination import CursorPagination
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Count, Prefetch
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from django_filters.rest_framework import DjangoFilterBackend
 
@@ -12,13 +13,24 @@ from .serializers import (
     OrganizationSerializer, OrganizationDetailSerializer,
     OrganizationMemberSerializer, MembershipRequestSerializer,
     MembershipJoinSerializer, MembershipActionSerializer,
-    MemberRoleUpdateSerializer, OrganizationStatisticsSerializer
+    MemberRoleUpdateSerializer, OrganizationStatisticsSerializer,
+    BulkMembershipActionSerializer
 )
 from .permissions import (
     IsOrganizationOwnerOrAdmin, IsOrganizationMember, CanManageMembers
 )
 
 
+class MemberCursorPagination(CursorPagination):
+    """
+    Keyset pagination for membership lists.
+    
+    Pages seek on the created_at index instead of skipping OFFSET rows, so
+    deep pages of large organizations cost the same as the first.
+    """
+    ordering = '-created_at'
+
+
 @extend_schema_view(
     list=extend_schema(description='List all organizations user has access to'),
     retrieve=extend_schema(description='Retrieve organization details'),
@@ -41,6 +53,8 @@ class OrganizationViewSet(viewsets.ModelViewSet):
     search_fields = ['name', 'description']
     ordering_fields = ['created_at', 'name']
     lookup_field = 'slug'
+    # Unpaginated actions stream rows instead of caching every instance
+    iterator_chunk_size = 200
     
     def get_queryset(self):
         """
@@ -49,16 +63,56 @@ class OrganizationViewSet(viewsets.ModelViewSet):
         """
         user = self.request.user
         
-        if self.action == 'list':
-            if user.is_super_admin():
-                return Organization.objects.all()
-            return Organization.objects.filter(
-                Q(owner=user) |
-                Q(members__user=user, members__membership_status=MembershipStatus.APPROVED)
-            ).distinct()
+        if self.action == 'list' and not user.is_super_admin():
+            queryset = Organization.objects.filter(
+                Q(owner=user) | OrganizationMember.approved_exists(user, 'pk')
+            )
+        else:
+            # For detail view, return all and let permissions handle access
+            queryset = Organization.objects.all()
+        
+        if self.action == 'retrieve':
+            # Members listed by OrganizationDetailSerializer, with the rows they render
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    'members',
+                    queryset=OrganizationMember.objects.filter(
+                        membership_status=MembershipStatus.APPROVED
+                    ).for_serializer(),
+                    to_attr='approved_members'
+                )
+            )
+        
+        return self.annotate_for_serializer(queryset)
     
-        # For detail view, return all and let permissions handle access
-        return Organization.objects.all()
+    def annotate_for_serializer(self, queryset):
+        """Attach the counts and membership flags OrganizationSerializer reads."""
+        queryset = queryset.annotate(
+            _member_count=OrganizationMember.count_subquery(
+                'pk',
+                membership_status=MembershipStatus.APPROVED
+            ),
+            _admin_count=OrganizationMember.count_subquery(
+                'pk',
+                membership_status=MembershipStatus.APPROVED,
+                role=MemberRole.ADMIN
+            ),
+        ).select_related('owner').only(
+            # Every organization column, but only the owner columns rendered
+            *(field.name for field in Organization._meta.concrete_fields),
+            'owner__email', 'owner__first_name', 'owner__last_name',
+        )
+        
+        user = self.request.user
+        if user.is_authenticated:
+            queryset = queryset.annotate(
+                _is_member=OrganizationMember.approved_exists(user, 'pk'),
+                _is_admin=OrganizationMember.approved_exists(
+                    user, 'pk', role=MemberRole.ADMIN
+                ),
+            )
+        
+        return queryset
     
     def get_serializer_class(self):
         """Return appropriate serializer."""
@@ -70,7 +124,8 @@ class OrganizationViewSet(viewsets.ModelViewSet):
         """Set permissions based on action."""
         if self.action in ['update', 'partial_update', 'destroy', 'suspend', 'activate']:
             return [IsAuthenticated(), IsOrganizationOwnerOrAdmin()]
-        return [IsAuthenticated()]
+        # Falls back to permission_classes, including those set on @action
+        return super().get_permissions()
     
     @extend_schema(
         description='Get organizations owned by current user',
@@ -79,8 +134,12 @@ class OrganizationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def my_organizations(self, request):
         """Get organizations owned by current user."""
-        orgs = Organization.objects.filter(owner=request.user)
-        serializer = self.get_serializer(orgs, many=True)
+        orgs = self.annotate_for_serializer(
+            Organization.objects.filter(owner=request.user)
+        )
+        serializer = self.get_serializer(
+            orgs.iterator(chunk_size=self.iterator_chunk_size), many=True
+        )
         return Response(serializer.data)
     
     @extend_schema(
@@ -90,11 +149,15 @@ class OrganizationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def joined_organizations(self, request):
         """Get organizations where user is an approved member."""
-        orgs = Organization.objects.filter(
-            members__user=request.user,
-            members__membership_status=MembershipStatus.APPROVED
+        orgs = self.annotate_for_serializer(
+            Organization.objects.filter(
+                members__user=request.user,
+                members__membership_status=MembershipStatus.APPROVED
+            )
+        )
+        serializer = self.get_serializer(
+            orgs.iterator(chunk_size=self.iterator_chunk_size), many=True
         )
-        serializer = self.get_serializer(orgs, many=True)
         return Response(serializer.data)
     
     @extend_schema(
@@ -105,12 +168,8 @@ class OrganizationViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['post'], permission_classes=[IsAuthenticated, IsOrganizationOwnerOrAdmin])
     def invite_member(self, request, slug=None):
         """Invite a user to join the organization."""
+        # IsOrganizationOwnerOrAdmin already limits this to managers
         organization = self.get_object()
-        if not organization.can_manage(request.user):
-            return Response(
-                {'error': 'You do not have permission to invite members.'},
-                status=status.HTTP_403_FORBIDDEN
-            )
     
         serializer = MembershipRequestSerializer(
             data=request.data,
@@ -142,35 +201,30 @@ class OrganizationViewSet(viewsets.ModelViewSet):
         serializer = MembershipJoinSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        organization = get_object_or_404(
-            Organization,
-            slug=serializer.validated_data['organization_slug']
-        )
+        organization = serializer.validated_data['organization']
         
         # Check if user is owner
-        if organization.owner == request.user:
+        if organization.owner_id == request.user.id:
             return Response(
                 {'error': 'You are the owner of this organization.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Check if membership already exists
-        if OrganizationMember.objects.filter(
-            user=request.user,
-            organization=organization
-        ).exists():
+        # The (user, organization) unique constraint rejects existing memberships
+        try:
+            with transaction.atomic():
+                member = OrganizationMember.objects.create(
+                    user=request.user,
+                    organization=organization,
+                    role=MemberRole.VOTER,
+                    membership_status=MembershipStatus.PENDING
+                )
+        except IntegrityError:
             return Response(
                 {'error': 'You already have a membership request or are a member.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        member = OrganizationMember.objects.create(
-            user=request.user,
-            organization=organization,
-            role=MemberRole.VOTER,
-            membership_status=MembershipStatus.PENDING
-        )
-        
         return Response(
             OrganizationMemberSerializer(member).data,
             status=status.HTTP_201_CREATED
@@ -185,23 +239,7 @@ class OrganizationViewSet(viewsets.ModelViewSet):
         """Get organization statistics."""
         organization = self.get_object()
         
-        members = organization.members.all()
-        stats = {
-            'total_members': members.count(),
-            'approved_members': members.filter(membership_status=MembershipStatus.APPROVED).count(),
-            'pending_members': members.filter(membership_status=MembershipStatus.PENDING).count(),
-            'rejected_members': members.filter(membership_status=MembershipStatus.REJECTED).count(),
-            'admin_count': members.filter(
-                membership_status=MembershipStatus.APPROVED,
-                role=MemberRole.ADMIN
-            ).count(),
-            'voter_count': members.filter(
-                membership_status=MembershipStatus.APPROVED,
-                role=MemberRole.VOTER
-            ).count(),
-            'total_elections': organization.elections.count() if hasattr(organization, 'elections') else 0,
-            'active_elections': organization.elections.filter(status='ongoing').count() if hasattr(organization, 'elections') else 0,
-        }
+        stats = organization.get_statistics()
         
         return Response(stats)
     
@@ -245,6 +283,7 @@ class OrganizationMemberViewSet(viewsets.ModelViewSet):
     """
     serializer_class = OrganizationMemberSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = MemberCursorPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['membership_status', 'role']
     ordering_fields = ['created_at']
@@ -253,21 +292,23 @@ class OrganizationMemberViewSet(viewsets.ModelViewSet):
         """Return members based on organization access."""
         user = self.request.user
         
+        queryset = OrganizationMember.objects.for_serializer()
+        
         if user.is_super_admin():
-            return OrganizationMember.objects.all()
+            return queryset
         
         # Get members of organizations user can access
-        return OrganizationMember.objects.filter(
+        return queryset.filter(
             Q(organization__owner=user) |
-            Q(organization__members__user=user, 
-              organization__members__membership_status=MembershipStatus.APPROVED)
-        ).distinct()
+            OrganizationMember.approved_exists(user, 'organization')
+        )
     
     def get_permissions(self):
         """Set permissions based on action."""
         if self.action in ['update', 'partial_update', 'destroy']:
             return [IsAuthenticated(), CanManageMembers()]
-        return [IsAuthenticated()]
+        # Falls back to permission_classes, including those set on @action
+        return super().get_permissions()
     
     @extend_schema(
         description='Get pending membership requests',
@@ -276,21 +317,43 @@ class OrganizationMemberViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def pending(self, request):
         """Get all pending membership requests for organizations user manages."""
-        user = request.user
+        members = self.get_reviewable_requests()
+        serializer = self.get_serializer(members, many=True)
+        return Response(serializer.data)
+    
+    @extend_schema(
+        description='Approve or reject several membership requests at once',
+        request=BulkMembershipActionSerializer,
+        responses={200: dict}
+    )
+    @action(detail=False, methods=['post'])
+    def bulk_review(self, request):
+        """Approve or reject pending requests in organizations user manages."""
+        serializer = BulkMembershipActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
         
-        members = OrganizationMember.objects.filter(
-            organization__owner=user,
-            membership_status=MembershipStatus.PENDING
-        ) | OrganizationMember.objects.filter(
-            organization__members__user=user,
-            organization__members__role=MemberRole.ADMIN,
-            organization__members__membership_status=MembershipStatus.APPROVED,
-            membership_status=MembershipStatus.PENDING
+        # Requests outside the user's organizations are silently skipped
+        members = self.get_reviewable_requests().filter(
+            pk__in=serializer.validated_data['ids']
         )
         
-        members = members.distinct()
-        serializer = self.get_serializer(members, many=True)
-        return Response(serializer.data)
+        if serializer.validated_data['action'] == 'approve':
+            updated = members.bulk_approve()
+            message = f'{updated} membership request(s) approved.'
+        else:
+            updated = members.bulk_reject()
+            message = f'{updated} membership request(s) rejected.'
+        
+        return Response({'message': message, 'updated': updated})
+    
+    def get_reviewable_requests(self):
+        """Pending requests in organizations the user owns or administers."""
+        user = self.request.user
+        return OrganizationMember.objects.for_serializer().filter(
+            Q(organization__owner=user) |
+            OrganizationMember.approved_exists(user, 'organization', role=MemberRole.ADMIN),
+            membership_status=MembershipStatus.PENDING
+        )
     
     @extend_schema(
         description='Approve or reject membership request',
@@ -315,7 +378,7 @@ class OrganizationMemberViewSet(viewsets.ModelViewSet):
         
         return Response({
             'message': message,
-            'member': OrganizationMemberSerializer(member).data
+            'member': self.get_serializer(member).data
         })
     
     @extend_schema(
@@ -348,7 +411,7 @@ class OrganizationMemberViewSet(viewsets.ModelViewSet):
         
         return Response({
             'message': message,
-            'member': OrganizationMemberSerializer(member).data
+            'member': self.get_serializer(member).data
         })
     
     @extend_schema(
@@ -368,7 +431,7 @@ class OrganizationMemberViewSet(viewsets.ModelViewSet):
             )
         
         # Cannot leave if you're the owner
-        if member.organization.owner == request.user:
+        if member.organization.owner_id == request.user.id:
             return Response(
                 {'error': 'Organization owners cannot leave. Transfer ownership or delete the organization.'},
                 status=status.HTTP_400_BAD_REQUEST
@@ -13,16 +13,13 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 # Auto-discover tasks in all installed apps
 app.autodiscover_tasks()
 
-# Windows-specific settings
+# Prefetch and ack behaviour come from CELERY_* settings
 app.conf.update(
     task_serializer='json',
     accept_content=['json'],
     result_serializer='json',
     timezone='UTC',
     enable_utc=True,
-    # Windows-specific settings
-    worker_prefetch_multiplier=1,  # Windows compatibility
-    task_acks_late=False,  # Windows compatibility
 )
 
 # Celery Beat Schedule for periodic tasks
@@ -1,11 +1,29 @@
-from celery import shared_task
+from celery import shared_task, group
 from django.core.mail import send_mail
 from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
 from elections.models import Election, ElectionStatus
 
 
+def _sweep(elections, to_status, now):
+    """
+    Move every election in the queryset to to_status with a single UPDATE.
+    
+    Returns the ids that were moved. Matching rows stay locked until the
+    UPDATE commits, and rows a concurrent start()/end() holds are skipped,
+    so no election is moved or notified twice.
+    """
+    with transaction.atomic():
+        ids = list(
+            elections.select_for_update(skip_locked=True).values_list('id', flat=True)
+        )
+        if ids:
+            Election.objects.filter(pk__in=ids).update(status=to_status, updated_at=now)
+    return ids
+
+
 @shared_task
 def update_election_statuses():
     """
@@ -13,36 +31,35 @@ def update_election_statuses():
     Runs every 5 minutes via Celery Beat.
     """
     now = timezone.now()
-    updated_count = 0
     
     # Update scheduled elections to ongoing
-    scheduled_elections = Election.objects.filter(
-        status=ElectionStatus.SCHEDULED,
-        start_at__lte=now,
-        end_at__gt=now
+    started_ids = _sweep(
+        Election.objects.filter(
+            status=ElectionStatus.SCHEDULED,
+            start_at__lte=now,
+            end_at__gt=now
+        ),
+        ElectionStatus.ONGOING,
+        now
     )
-    for election in scheduled_elections:
-        election.status = ElectionStatus.ONGOING
-        election.save(update_fields=['status', 'updated_at'])
-        
-        # Send notification that election has started
-        send_election_started_notification.delay(election.id)
-        updated_count += 1
     
     # Update ongoing elections to completed
-    ongoing_elections = Election.objects.filter(
-        status=ElectionStatus.ONGOING,
-        end_at__lte=now
+    ended_ids = _sweep(
+        Election.objects.filter(
+            status=ElectionStatus.ONGOING,
+            end_at__lte=now
+        ),
+        ElectionStatus.COMPLETED,
+        now
     )
-    for election in ongoing_elections:
-        election.status = ElectionStatus.COMPLETED
-        election.save(update_fields=['status', 'updated_at'])
-        
-        # Send notification that election has ended
-        send_election_ended_notification.delay(election.id)
-        updated_count += 1
     
-    return f"Updated {updated_count} elections"
+    # Enqueue notifications as groups so they share one broker connection
+    if started_ids:
+        group(send_election_started_notification.s(eid) for eid in started_ids).apply_async()
+    if ended_ids:
+        group(send_election_ended_notification.s(eid) for eid in ended_ids).apply_async()
+    
+    return f"Updated {len(started_ids) + len(ended_ids)} elections"
 
 
 @shared_task
@@ -55,26 +72,25 @@ def send_election_reminders():
     tomorrow = now + timedelta(days=1)
     
     # Elections starting tomorrow
-    upcoming_elections = Election.objects.filter(
+    upcoming_ids = list(Election.objects.filter(
         status=ElectionStatus.SCHEDULED,
         start_at__gte=now,
         start_at__lt=tomorrow
-    )
-    
-    for election in upcoming_elections:
-        send_election_starting_soon_email.delay(election.id)
+    ).values_list('id', flat=True))
     
     # Elections ending tomorrow
-    ending_elections = Election.objects.filter(
+    ending_ids = list(Election.objects.filter(
         status=ElectionStatus.ONGOING,
         end_at__gte=now,
         end_at__lt=tomorrow
-    )
+    ).values_list('id', flat=True))
     
-    for election in ending_elections:
-        send_election_ending_soon_email.delay(election.id)
+    reminders = [send_election_starting_soon_email.s(eid) for eid in upcoming_ids]
+    reminders += [send_election_ending_soon_email.s(eid) for eid in ending_ids]
+    if reminders:
+        group(reminders).apply_async()
     
-    return f"Sent reminders for {upcoming_elections.count() + ending_elections.count()} elections"
+    return f"Sent reminders for {len(reminders)} elections"
 
 
 @shared_task
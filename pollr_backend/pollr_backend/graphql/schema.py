@@ -211,8 +211,8 @@ class Query(graphene.ObjectType):
         
         return Organization.objects.filter(
             models.Q(owner=user) |
-            models.Q(members__user=user, members__membership_status='approved')
-        ).distinct()
+            OrganizationMember.approved_exists(user, 'pk')
+        )
     
     def resolve_my_organizations(self, info):
         user = info.context.user
@@ -234,9 +234,8 @@ class Query(graphene.ObjectType):
         
         return Election.objects.filter(
             models.Q(organization__owner=user) |
-            models.Q(organization__members__user=user,
-                    organization__members__membership_status='approved')
-        ).distinct()
+            OrganizationMember.approved_exists(user, 'organization')
+        )
     
     def resolve_active_elections(self, info):
         user = info.context.user
@@ -250,9 +249,8 @@ class Query(graphene.ObjectType):
         
         return base_query.filter(
             models.Q(organization__owner=user) |
-            models.Q(organization__members__user=user,
-                    organization__members__membership_status='approved')
-        ).distinct()
+            OrganizationMember.approved_exists(user, 'organization')
+        )
     
     # Position resolvers
     def resolve_position(self, info, id):
@@ -330,7 +328,7 @@ class CreateElection(graphene.Mutation):
         if not organization.can_manage(user):
             raise Exception('Permission denied')
         
-        election = Election.objects.create(
+        election = Election(
             organization=organization,
             title=title,
             description=description or '',
@@ -338,6 +336,8 @@ class CreateElection(graphene.Mutation):
             end_at=end_at,
             result_visibility=result_visibility
         )
+        election.clean()
+        election.save()
         return CreateElection(election=election)
 
 
@@ -376,7 +376,7 @@ class CastVote(graphene.Mutation):
             'candidate': candidate,
         }
         
-        if election.organization.owner == user:
+        if election.organization.owner_id == user.id:
             vote_data['voter_user'] = user
         else:
             member = OrganizationMember.objects.get(
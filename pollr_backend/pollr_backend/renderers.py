@@ -0,0 +1,30 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+    
+    Types orjson cannot encode natively (Decimal, lazy strings, querysets)
+    fall back to DRF's JSONEncoder, so output matches JSONRenderer.
+    """
+    
+    _encoder = JSONEncoder()
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render data into compact UTF-8 JSON."""
+        if data is None:
+            return b''
+        
+        # orjson only indents by two spaces, so honour indent=N (browsable
+        # API, "Accept: application/json; indent=4") with DRF's renderer
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        return orjson.dumps(
+            data,
+            default=self._encoder.default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
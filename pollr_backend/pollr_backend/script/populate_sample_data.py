@@ -458,18 +458,13 @@ council_sec_pos = Position.objects.create(
 )
 
 # Candidates
-Candidate.objects.create(
-    position=council_pres_pos,
-    user=david,
-    name=david.get_full_name() or david.email,
-    manifesto='Student voice matters! I will ensure every student is heard and represented.'
-)
-
-Candidate.objects.create(
-    position=council_pres_pos,
-    user=emma,
-    name=emma.get_full_name() or emma.email,
-    manifesto='Building bridges between students and administration for real change.'
+Candidate.bulk_import(
+    council_pres_pos,
+    [david.id, emma.id],
+    [
+        'Student voice matters! I will ensure every student is heard and represented.',
+        'Building bridges between students and administration for real change.',
+    ]
 )
 
 Candidate.objects.create(
@@ -0,0 +1,24 @@
+"""
+Django settings for running the test suite.
+
+Starts from the project settings and only overrides what slows tests down.
+"""
+
+import os
+
+from .settings import *  # noqa: F401,F403
+
+# Fixtures create users constantly; PBKDF2 would dominate their setup time
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Opt-in in-memory SQLite for quick local runs without a PostgreSQL server.
+# CI keeps PostgreSQL so the suite still exercises the production backend.
+if os.environ.get('TEST_DATABASE') == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
+    }
@@ -128,11 +128,11 @@ class User(AbstractBaseUser, PermissionsMixin):
     
     def get_organizations(self):
         """Get all organizations the user belongs to."""
-        from organizations.models import Organization
+        from organizations.models import Organization, OrganizationMember
         return Organization.objects.filter(
             models.Q(owner=self) |
-            models.Q(members__user=self, members__membership_status='approved')
-        ).distinct()
+            OrganizationMember.approved_exists(self, 'pk')
+        )
     
     def activate(self):
         """Activate the user account."""
@@ -8,6 +8,13 @@ from .models import UserRole, UserStatus
 
 User = get_user_model()
 
+USER_LIST_URL = reverse('users:user-list')
+USER_ME_URL = reverse('users:user-me')
+CHANGE_PASSWORD_URL = reverse('users:user-change-password')
+USER_STATISTICS_URL = reverse('users:user-statistics')
+TOKEN_OBTAIN_URL = reverse('users:token_obtain_pair')
+TOKEN_REFRESH_URL = reverse('users:token_refresh')
+
 
 @pytest.fixture
 def api_client():
@@ -59,7 +66,6 @@ class TestUserRegistration:
     
     def test_register_user_success(self, api_client):
         """Test successful user registration."""
-        url = reverse('users:user-list')
         data = {
             'email': 'newuser@example.com',
             'password': 'newpass123',
@@ -68,7 +74,7 @@ class TestUserRegistration:
             'last_name': 'User'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(USER_LIST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
         assert User.objects.filter(email='newuser@example.com').exists()
@@ -76,7 +82,6 @@ class TestUserRegistration:
     
     def test_register_user_password_mismatch(self, api_client):
         """Test registration with mismatched passwords."""
-        url = reverse('users:user-list')
         data = {
             'email': 'newuser@example.com',
             'password': 'newpass123',
@@ -85,14 +90,13 @@ class TestUserRegistration:
             'last_name': 'User'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(USER_LIST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'password_confirm' in response.data
     
     def test_register_user_duplicate_email(self, api_client, regular_user):
         """Test registration with existing email."""
-        url = reverse('users:user-list')
         data = {
             'email': regular_user.email,
             'password': 'newpass123',
@@ -101,7 +105,7 @@ class TestUserRegistration:
             'last_name': 'User'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(USER_LIST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'email' in response.data
@@ -113,13 +117,12 @@ class TestUserAuthentication:
     
     def test_login_success(self, api_client, regular_user):
         """Test successful login."""
-        url = reverse('users:token_obtain_pair')
         data = {
             'email': 'user@example.com',
             'password': 'testpass123'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(TOKEN_OBTAIN_URL, data, format='json')
         
         assert response.status_code == status.HTTP_200_OK
         assert 'access' in response.data
@@ -127,20 +130,19 @@ class TestUserAuthentication:
     
     def test_login_invalid_credentials(self, api_client, regular_user):
         """Test login with invalid credentials."""
-        url = reverse('users:token_obtain_pair')
         data = {
             'email': 'user@example.com',
             'password': 'wrongpassword'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(TOKEN_OBTAIN_URL, data, format='json')
         
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
     def test_refresh_token(self, api_client, regular_user):
         """Test token refresh."""
         # First, login to get tokens
-        login_url = reverse('users:token_obtain_pair')
+        login_url = TOKEN_OBTAIN_URL
         login_data = {
             'email': 'user@example.com',
             'password': 'testpass123'
@@ -149,7 +151,7 @@ class TestUserAuthentication:
         refresh_token = login_response.data['refresh']
         
         # Then refresh the token
-        refresh_url = reverse('users:token_refresh')
+        refresh_url = TOKEN_REFRESH_URL
         refresh_data = {'refresh': refresh_token}
         
         response = api_client.post(refresh_url, refresh_data, format='json')
@@ -165,9 +167,8 @@ class TestUserProfile:
     def test_get_own_profile(self, api_client, regular_user):
         """Test getting own profile."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('users:user-me')
         
-        response = api_client.get(url)
+        response = api_client.get(USER_ME_URL)
         
         assert response.status_code == status.HTTP_200_OK
         assert response.data['email'] == regular_user.email
@@ -204,14 +205,13 @@ class TestPasswordChange:
     def test_change_password_success(self, api_client, regular_user):
         """Test successful password change."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('users:user-change-password')
         data = {
             'old_password': 'testpass123',
             'new_password': 'newpass456',
             'new_password_confirm': 'newpass456'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(CHANGE_PASSWORD_URL, data, format='json')
         
         assert response.status_code == status.HTTP_200_OK
         regular_user.refresh_from_db()
@@ -220,14 +220,13 @@ class TestPasswordChange:
     def test_change_password_wrong_old(self, api_client, regular_user):
         """Test password change with wrong old password."""
         api_client.force_authenticate(user=regular_user)
-        url = reverse('users:user-change-password')
         data = {
             'old_password': 'wrongpass',
             'new_password': 'newpass456',
             'new_password_confirm': 'newpass456'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(CHANGE_PASSWORD_URL, data, format='json')
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
@@ -239,9 +238,8 @@ class TestUserAdministration:
     def test_super_admin_list_users(self, api_client, super_admin, regular_user):
         """Test super admin can list all users."""
         api_client.force_authenticate(user=super_admin)
-        url = reverse('users:user-list')
         
-        response = api_client.get(url)
+        response = api_client.get(USER_LIST_URL)
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) >= 2
@@ -279,9 +277,8 @@ class TestUserAdministration:
     def test_get_user_statistics(self, api_client, super_admin, regular_user, org_admin):
         """Test getting user statistics."""
         api_client.force_authenticate(user=super_admin)
-        url = reverse('users:user-statistics')
         
-        response = api_client.get(url)
+        response = api_client.get(USER_STATISTICS_URL)
         
         assert response.status_code == status.HTTP_200_OK
         assert 'total_users' in response.data
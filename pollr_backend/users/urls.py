@@ -1,11 +1,11 @@
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from .views import UserViewSet
 
 app_name = 'users'
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register(r'', UserViewSet, basename='user')
 
 urlpatterns = [
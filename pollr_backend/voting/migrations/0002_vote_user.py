@@ -0,0 +1,48 @@
+# Generated by Django 5.2.8 on 2026-10-14 17:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_vote_users(apps, schema_editor):
+    Vote = apps.get_model('voting', 'Vote')
+    OrganizationMember = apps.get_model('organizations', 'OrganizationMember')
+
+    # Owner votes already reference the user directly
+    Vote.objects.filter(
+        user__isnull=True,
+        voter_user__isnull=False
+    ).update(user=models.F('voter_user'))
+
+    # Member votes resolve the user through the membership
+    member_user = OrganizationMember.objects.filter(
+        pk=models.OuterRef('voter')
+    ).values('user')[:1]
+    Vote.objects.filter(
+        user__isnull=True,
+        voter__isnull=False
+    ).update(user=models.Subquery(member_user))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0001_initial'),
+        ('organizations', '0006_merge_20251129_2254'),
+        ('voting', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vote',
+            name='user',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='cast_votes', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['election', 'user'], name='votes_electio_c5d955_idx'),
+        ),
+        migrations.RunPython(backfill_vote_users, migrations.RunPython.noop),
+    ]
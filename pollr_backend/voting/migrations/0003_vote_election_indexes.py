@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-14 17:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voting', '0002_vote_user'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['election', 'candidate'], name='votes_electio_8024c7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['election', 'voter'], name='votes_electio_71fa8f_idx'),
+        ),
+    ]
@@ -36,6 +36,15 @@ class Vote(models.Model):
         null=True,
         blank=True
     )
+    # Denormalized user who cast the ballot (member's user or owner)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='cast_votes',
+        null=True,
+        blank=True,
+        editable=False
+    )
     vote_token = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
     
     # Timestamp
@@ -46,9 +55,12 @@ class Vote(models.Model):
         ordering = ['created_at']
         indexes = [
             models.Index(fields=['election', 'position']),
+            models.Index(fields=['election', 'candidate']),
+            models.Index(fields=['election', 'voter']),
             models.Index(fields=['candidate']),
             models.Index(fields=['voter']),
             models.Index(fields=['voter_user']),
+            models.Index(fields=['election', 'user']),
             models.Index(fields=['created_at']),
             models.Index(fields=['vote_token']),
         ]
@@ -80,34 +92,76 @@ class Vote(models.Model):
         validate = kwargs.pop('validate', True)
         if validate:
             self.clean()
+        if self.user_id is None:
+            self.user_id = self.voter_user_id or (self.voter.user_id if self.voter else None)
         super().save(*args, **kwargs)
     
     @classmethod
     def has_user_voted_for_position(cls, election, position, user):
         """Check if user has already voted for a position."""
-        # Check as member
-        voted_as_member = cls.objects.filter(
-            election=election,
-            position=position,
-            voter__user=user
-        ).exists()
-        
-        # Check as owner
-        voted_as_owner = cls.objects.filter(
+        return cls.objects.filter(
             election=election,
             position=position,
-            voter_user=user
+            user=user
         ).exists()
-        
-        return voted_as_member or voted_as_owner
     
     @classmethod
     def get_user_votes_for_election(cls, election, user):
         """Get all votes cast by user in an election."""
-        return cls.objects.filter(
-            models.Q(voter__user=user) | models.Q(voter_user=user),
+        return cls.objects.filter(election=election, user=user)
+    
+    @classmethod
+    def get_voted_election_ids(cls, user, election_ids=None):
+        """
+        Get IDs of the elections the user has voted in.
+        
+        election_ids limits the lookup to those elections instead of the
+        user's whole voting history.
+        """
+        votes = cls.objects.filter(user=user)
+        if election_ids is not None:
+            votes = votes.filter(election_id__in=election_ids)
+        return set(votes.values_list('election_id', flat=True).distinct())
+    
+    @classmethod
+    def count_subquery(cls, election_ref, field='pk', distinct=False):
+        """
+        Correlated COUNT of votes for annotating an election queryset.
+        
+        election_ref names the outer field holding the election, and field
+        with distinct=True counts unique values such as voting users.
+        """
+        from django.db.models import Count, OuterRef, Subquery
+        from django.db.models.functions import Coalesce
+        
+        counts = cls.objects.filter(
+            election=OuterRef(election_ref)
+        ).order_by().values('election').annotate(
+            count=Count(field, distinct=distinct)
+        ).values('count')
+        return Coalesce(Subquery(counts), 0)
+    
+    @classmethod
+    def get_tallies_for_election(cls, election):
+        """Get vote counts per candidate and per position in one query."""
+        from django.db.models import Count
+        
+        candidate_tallies = {}
+        position_totals = {}
+        rows = cls.objects.filter(
             election=election
-        )
+        ).values_list(
+            'position_id',
+            'candidate_id'
+        ).annotate(
+            vote_count=Count('id')
+        ).order_by()
+        
+        for position_id, candidate_id, vote_count in rows:
+            candidate_tallies[candidate_id] = vote_count
+            position_totals[position_id] = position_totals.get(position_id, 0) + vote_count
+        
+        return candidate_tallies, position_totals
     
     @classmethod
     def get_results_for_election(cls, election):
@@ -62,7 +62,7 @@ class CastVoteSerializer(serializers.Serializer):
             )
         
         # Check if user is eligible to vote (member or owner)
-        if not election.organization.is_member(user) and election.organization.owner != user:
+        if election.organization.owner_id != user.id and not election.organization.is_member(user):
             raise serializers.ValidationError(
                 'You are not eligible to vote in this election.'
             )
@@ -97,7 +97,7 @@ class BulkVoteSerializer(serializers.Serializer):
             )
         
         # Check if user is eligible to vote
-        if not election.organization.is_member(user) and election.organization.owner != user:
+        if election.organization.owner_id != user.id and not election.organization.is_member(user):
             raise serializers.ValidationError(
                 'You are not eligible to vote in this election.'
             )
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from elections.models import Election
+
+from .models import Vote
+
+
+@receiver([post_save, post_delete], sender=Vote)
+def clear_election_stats_cache(sender, instance, **kwargs):
+    """Invalidate cached election statistics when votes change."""
+    if Vote.election.is_cached(instance):
+        instance.election.clear_stats_cache()
+    else:
+        # Avoid a SELECT per vote, e.g. when a deleted election cascades
+        Election.bump_stats_version(instance.election_id)
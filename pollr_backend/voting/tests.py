@@ -12,6 +12,12 @@ from organizations.models import Organization, OrganizationMember, MembershipSta
 
 User = get_user_model()
 
+VOTE_CAST_URL = reverse('voting:vote-cast')
+VOTE_BULK_CAST_URL = reverse('voting:vote-bulk-cast')
+VOTE_RESULTS_URL = reverse('voting:vote-results')
+VOTE_POSITION_RESULTS_URL = reverse('voting:vote-position-results')
+MY_VOTES_URL = reverse('voting:vote-my-votes')
+
 
 @pytest.fixture
 def api_client():
@@ -143,14 +149,13 @@ class TestVoteCasting:
     def test_cast_vote_as_owner(self, api_client, user, active_election, position, candidate1):
         """Test casting a vote as organization owner."""
         api_client.force_authenticate(user=user)
-        url = reverse('voting:vote-cast')
         data = {
             'election_id': active_election.id,
             'position_id': position.id,
             'candidate_id': candidate1.id
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(VOTE_CAST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
         assert Vote.objects.filter(
@@ -163,14 +168,13 @@ class TestVoteCasting:
     def test_cast_vote_as_member(self, api_client, another_user, member, active_election, position, candidate1):
         """Test casting a vote as organization member."""
         api_client.force_authenticate(user=another_user)
-        url = reverse('voting:vote-cast')
         data = {
             'election_id': active_election.id,
             'position_id': position.id,
             'candidate_id': candidate1.id
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(VOTE_CAST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
         assert Vote.objects.filter(
@@ -183,7 +187,6 @@ class TestVoteCasting:
     def test_cannot_vote_twice_same_position(self, api_client, user, active_election, position, candidate1, candidate2):
         """Test that user cannot vote twice for same position."""
         api_client.force_authenticate(user=user)
-        url = reverse('voting:vote-cast')
         
         # First vote
         data1 = {
@@ -191,7 +194,7 @@ class TestVoteCasting:
             'position_id': position.id,
             'candidate_id': candidate1.id
         }
-        response1 = api_client.post(url, data1, format='json')
+        response1 = api_client.post(VOTE_CAST_URL, data1, format='json')
         assert response1.status_code == status.HTTP_201_CREATED
         
         # Second vote for same position
@@ -200,7 +203,7 @@ class TestVoteCasting:
             'position_id': position.id,
             'candidate_id': candidate2.id
         }
-        response2 = api_client.post(url, data2, format='json')
+        response2 = api_client.post(VOTE_CAST_URL, data2, format='json')
         assert response2.status_code == status.HTTP_400_BAD_REQUEST
     
     def test_cannot_vote_inactive_election(self, api_client, user, completed_election):
@@ -215,28 +218,26 @@ class TestVoteCasting:
         )
         
         api_client.force_authenticate(user=user)
-        url = reverse('voting:vote-cast')
         data = {
             'election_id': completed_election.id,
             'position_id': position.id,
             'candidate_id': candidate.id
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(VOTE_CAST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
     
     def test_vote_has_unique_token(self, api_client, user, active_election, position, candidate1):
         """Test that each vote has a unique token."""
         api_client.force_authenticate(user=user)
-        url = reverse('voting:vote-cast')
         data = {
             'election_id': active_election.id,
             'position_id': position.id,
             'candidate_id': candidate1.id
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(VOTE_CAST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
         assert 'vote_token' in response.data
@@ -255,7 +256,6 @@ class TestBulkVoting:
         )
         
         api_client.force_authenticate(user=user)
-        url = reverse('voting:vote-bulk-cast')
         data = {
             'election_id': active_election.id,
             'votes': [
@@ -264,7 +264,7 @@ class TestBulkVoting:
             ]
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(VOTE_BULK_CAST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
         assert len(response.data) == 2
@@ -273,7 +273,6 @@ class TestBulkVoting:
     def test_bulk_vote_duplicate_position(self, api_client, user, active_election, position, candidate1, candidate2):
         """Test that bulk vote rejects duplicate positions."""
         api_client.force_authenticate(user=user)
-        url = reverse('voting:vote-bulk-cast')
         data = {
             'election_id': active_election.id,
             'votes': [
@@ -282,7 +281,7 @@ class TestBulkVoting:
             ]
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(VOTE_BULK_CAST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
     
@@ -303,7 +302,6 @@ class TestBulkVoting:
         )
         
         api_client.force_authenticate(user=user)
-        url = reverse('voting:vote-bulk-cast')
         data = {
             'election_id': active_election.id,
             'votes': [
@@ -313,7 +311,7 @@ class TestBulkVoting:
         }
         
         initial_count = Vote.objects.count()
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(VOTE_BULK_CAST_URL, data, format='json')
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         # No new votes should be created
@@ -365,9 +363,8 @@ class TestVoteResults:
         vote3.save(validate=False)
         
         api_client.force_authenticate(user=user)
-        url = reverse('voting:vote-results')
         
-        response = api_client.get(url, {'election_id': active_election.id})
+        response = api_client.get(VOTE_RESULTS_URL, {'election_id': active_election.id})
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) >= 1
@@ -379,9 +376,8 @@ class TestVoteResults:
         active_election.save()
         
         api_client.force_authenticate(user=another_user)
-        url = reverse('voting:vote-results')
         
-        response = api_client.get(url, {'election_id': active_election.id})
+        response = api_client.get(VOTE_RESULTS_URL, {'election_id': active_election.id})
         
         assert response.status_code == status.HTTP_403_FORBIDDEN
     
@@ -406,13 +402,52 @@ class TestVoteResults:
         vote.save(validate=False)
         
         api_client.force_authenticate(user=user)
-        url = reverse('voting:vote-position-results')
         
-        response = api_client.get(url, {'position_id': position.id})
+        response = api_client.get(VOTE_POSITION_RESULTS_URL, {'position_id': position.id})
         
         assert response.status_code == status.HTTP_200_OK
         assert response.data['total_votes'] == 1
         assert len(response.data['candidates']) >= 1
+    
+    def test_new_vote_invalidates_cached_total(self, user, active_election, position, candidate1):
+        """Test that casting a vote refreshes the cached election total."""
+        assert active_election.get_total_votes() == 0
+        
+        vote = Vote(
+            election=active_election,
+            position=position,
+            candidate=candidate1,
+            voter_user=user
+        )
+        vote.save(validate=False)
+        
+        assert active_election.get_total_votes() == 1
+        
+        vote.delete()
+        
+        assert active_election.get_total_votes() == 0
+    
+    def test_shared_cache_invalidated_by_election_id(
+        self, settings, tmp_path, django_assert_num_queries,
+        user, active_election, position, candidate1
+    ):
+        """Test that a vote bumps the shared stats version other processes read."""
+        settings.CACHES = {'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': str(tmp_path),
+        }}
+        assert Election.objects.get(pk=active_election.pk).get_total_votes() == 0
+        with django_assert_num_queries(1):
+            assert Election.objects.get(pk=active_election.pk).get_total_votes() == 0
+        
+        Vote(
+            election_id=active_election.pk,
+            position=position,
+            candidate=candidate1,
+            voter_user=user
+        ).save(validate=False)
+        
+        assert Election.objects.get(pk=active_election.pk).get_total_votes() == 1
 
 
 @pytest.mark.django_db
@@ -430,9 +465,8 @@ class TestMyVotes:
         vote.save(validate=False)
         
         api_client.force_authenticate(user=user)
-        url = reverse('voting:vote-my-votes')
         
-        response = api_client.get(url, {'election_id': active_election.id})
+        response = api_client.get(MY_VOTES_URL, {'election_id': active_election.id})
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 1
@@ -448,9 +482,8 @@ class TestMyVotes:
         vote.save(validate=False)
         
         api_client.force_authenticate(user=user)
-        url = reverse('voting:vote-my-votes')
         
-        response = api_client.get(url, {'election_id': active_election.id})
+        response = api_client.get(MY_VOTES_URL, {'election_id': active_election.id})
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 0  # Should not see other user's votes
\ No newline at end of file
@@ -1,10 +1,10 @@
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 from .views import VoteViewSet
 
 app_name = 'voting'
 
-router = DefaultRouter()
+router = SimpleRouter()
 router.register(r'', VoteViewSet, basename='vote')
 
 urlpatterns = [
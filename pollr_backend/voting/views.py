@@ -3,7 +3,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
-from django.db import transaction, models
+from django.db import transaction
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
 from .models import Vote
@@ -37,9 +37,7 @@ class VoteViewSet(viewsets.ReadOnlyModelViewSet):
             return Vote.objects.all()
         
         # Regular users can only see their own votes
-        return Vote.objects.filter(
-            models.Q(voter__user=user) | models.Q(voter_user=user)
-        )
+        return Vote.objects.filter(user=user)
     
     @extend_schema(
         description='Get current user votes for a specific election',
@@ -93,7 +91,7 @@ class VoteViewSet(viewsets.ReadOnlyModelViewSet):
         }
         
         # Determine if voting as member or owner
-        if election.organization.owner == request.user:
+        if election.organization.owner_id == request.user.id:
             vote_data['voter_user'] = request.user
         else:
             member = OrganizationMember.objects.get(
@@ -144,7 +142,7 @@ class VoteViewSet(viewsets.ReadOnlyModelViewSet):
                 }
                 
                 # Determine if voting as member or owner
-                if election.organization.owner == request.user:
+                if election.organization.owner_id == request.user.id:
                     vote_create_data['voter_user'] = request.user
                 else:
                     member = OrganizationMember.objects.get(